@@ -1,4 +1,4 @@
-from agents import Agent
+from agents import Agent, ModelSettings
 from agents.extensions.handoff_prompt import RECOMMENDED_PROMPT_PREFIX
 from utils.helper_functions import get_model_name
 
@@ -99,12 +99,14 @@ def create_feedback_analysis_agent(search_tool, handoff_agents: list = []):
 
           RULES:
           - Use filters ONLY when explicitly requested by user
-          - For multiple topics: Separate searches
+          - For multiple topics: Separate searches (issue them together in one step)
           - Mark low-confidence results
           - No results? Loosen filters or adjust query
           - Always respond in GERMAN language
         """,
         tools=tools,
+        # Mehrere Suchen (z.B. pro Thema) in einem Turn → werden parallel ausgeführt
+        model_settings=ModelSettings(parallel_tool_calls=True),
         reset_tool_choice=True,
         handoff_description="""
             Specialized in content-based feedback analysis and problem pattern recognition.
@@ -7,7 +7,7 @@ import sys
 import traceback
 from typing import Dict, Tuple, Optional
 from collections import defaultdict
-from datetime import datetime
+from datetime import datetime, timezone
 
 from ._shared import get_chart_path, plt
 
@@ -49,7 +49,7 @@ def create_time_analysis(data: Dict) -> Tuple[str, Optional[str]]:
 
             if date_timestamp and isinstance(date_timestamp, (int, float)):
                 try:
-                    date_obj = datetime.fromtimestamp(date_timestamp)
+                    date_obj = datetime.fromtimestamp(date_timestamp, tz=timezone.utc)
                     time_data.append(
                         {
                             "date": date_obj,
@@ -2,7 +2,7 @@ import os
 import sys
 import traceback
 from typing import Optional, Dict, Any
-from datetime import datetime
+from datetime import datetime, timezone
 from langchain_chroma import Chroma
 from agents import function_tool
 
@@ -39,10 +39,13 @@ def create_chart_creation_tool(collection: Chroma):
     print("\n🔧 Creating Analytics Tool...")
     print(f"   • Collection: {collection}")
     print(f"   • Collection Type: {type(collection)}")
+    # Dokumentanzahl einmalig ermitteln: die Collection ändert sich nach der
+    # Initialisierung nicht (Neuaufbau erzeugt auch ein neues Tool)
+    collection_count = None
     if collection:
         try:
-            count = collection.count()  # type: ignore[attr-defined]
-            print(f"   • Collection Count: {count}")
+            collection_count = collection.count()  # type: ignore[attr-defined]
+            print(f"   • Collection Count: {collection_count}")
         except Exception as e:
             print(f"   ⚠️ Collection Count Error: {e}")
     print()
@@ -124,6 +127,7 @@ def create_chart_creation_tool(collection: Chroma):
             - Auto-fallback for invalid analysis_type (query-based)
             - Smart validation prevents meaningless charts (e.g. Market chart with 1 market)
         """
+        nonlocal collection_count
         try:
             # ✅ DEBUG: Log Tool-Aufruf
             print(f"\n{'=' * 60}")
@@ -147,17 +151,16 @@ def create_chart_creation_tool(collection: Chroma):
                 sys.stdout.flush()
                 return error_msg
 
-            # ✅ Validierung: Collection Count
-            try:
-                collection_count = collection.count()  # type: ignore[attr-defined]
+            # ✅ INFO: Collection Count (beim Tool-Erstellen ermittelt;
+            # schlug das fehl, hier erneut versuchen und das Ergebnis merken)
+            if collection_count is None:
+                try:
+                    collection_count = collection.count()  # type: ignore[attr-defined]
+                except Exception as e:
+                    print(f"\n⚠️ Collection Count Error: {e}")
+            if collection_count is not None:
                 print(f"\n✅ Collection hat {collection_count} Dokumente")
-                sys.stdout.flush()
-            except Exception as e:
-                error_msg = f"❌ Error: Collection count fehlgeschlagen: {str(e)}"
-                print(f"\n{error_msg}\n")
-                traceback.print_exc()
-                sys.stdout.flush()
-                return error_msg
+            sys.stdout.flush()
 
             # ✅ INFO: Warnung bei komplett leeren Parametern
             if (not query.strip() and 
@@ -486,11 +489,9 @@ def _get_filtered_data(
         # Date range filtering - build separate conditions for ChromaDB
         date_conditions = []
         if date_from or date_to:
-            from datetime import datetime
-            
             if date_from:
                 try:
-                    date_from_obj = datetime.strptime(date_from, "%Y-%m-%d")
+                    date_from_obj = datetime.strptime(date_from, "%Y-%m-%d").replace(tzinfo=timezone.utc)
                     timestamp_from = int(date_from_obj.timestamp())
                     date_conditions.append({"date": {"$gte": timestamp_from}})
                     print(f"      ⏰ Date From: {date_from} → {timestamp_from}")
@@ -499,7 +500,7 @@ def _get_filtered_data(
             
             if date_to:
                 try:
-                    date_to_obj = datetime.strptime(date_to, "%Y-%m-%d")
+                    date_to_obj = datetime.strptime(date_to, "%Y-%m-%d").replace(tzinfo=timezone.utc)
                     # Set to end of day (23:59:59)
                     timestamp_to = int(date_to_obj.timestamp()) + 86399
                     date_conditions.append({"date": {"$lte": timestamp_to}})
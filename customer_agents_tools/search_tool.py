@@ -1,6 +1,180 @@
+import asyncio
+import json
+import threading
+import time
+from datetime import datetime, timezone
+
 from agents import function_tool
 
 
+class _SearchBatch:
+    """Pending batch of query texts that share the same filter and result count"""
+
+    def __init__(self):
+        self.query_texts = []
+        self.done = threading.Event()
+        self.rows = None
+        self.error = None
+
+
+class SearchBatcher:
+    """
+    Coalesces concurrent feedback searches into single collection.query calls.
+
+    Searches with identical where filter and n_results that arrive within
+    window_seconds are sent as one query_texts batch: one embedding request
+    and one ANN search instead of N round trips.
+
+    Attributes:
+        collection (Any): ChromaDB collection to query
+        window_seconds (float): Collection window opened by the first search of a batch
+        max_concurrent (int): Max. concurrently running batched queries
+        embedding_function (Any | None): Query embedding function (required for the query cache)
+        query_cache (SemanticQueryCache | None): Optional cache for repeated/similar queries
+    """
+
+    # Per-Query-Felder eines collection.query Ergebnisses
+    _RESULT_FIELDS = ("ids", "documents", "metadatas", "distances", "embeddings", "uris", "data")
+
+    def __init__(
+        self,
+        collection,
+        window_seconds: float = 0.015,
+        max_concurrent: int = 4,
+        embedding_function=None,
+        query_cache=None,
+    ):
+        self.collection = collection
+        self.window_seconds = window_seconds
+        self.embedding_function = embedding_function
+        # Semantischer Cache braucht die Query-Embeddings
+        self.query_cache = query_cache if embedding_function is not None else None
+        self._slots = threading.BoundedSemaphore(max_concurrent)
+        self._lock = threading.Lock()
+        self._pending = {}
+
+    def query(self, query_text: str, n_results: int, where: dict | None, include: list) -> dict:
+        """
+        Runs a single-text query through the batcher (blocking, call from a worker thread).
+
+        Args:
+            query_text (str): Semantic search query
+            n_results (int): Number of results
+            where (dict | None): Chroma where filter
+            include (list): Result fields to include
+
+        Returns:
+            dict: collection.query result shaped for exactly one query text
+
+        Raises:
+            Exception: Re-raises the error of the batched collection.query call
+        """
+        key = (n_results, json.dumps(where, sort_keys=True), tuple(include))
+
+        # Identischer Query-Text: Treffer ohne Embedding-Request
+        if self.query_cache is not None:
+            cached = self.query_cache.get_exact(key, query_text)
+            if cached is not None:
+                print("⚡ SEARCH CACHE: exakter Treffer")
+                return cached
+
+        with self._lock:
+            batch = self._pending.get(key)
+            is_leader = batch is None
+            if is_leader:
+                batch = _SearchBatch()
+                self._pending[key] = batch
+            position = len(batch.query_texts)
+            batch.query_texts.append(query_text)
+
+        if is_leader:
+            # Erster Aufruf sammelt kurz weitere Suchen mit gleichem Filter ein
+            time.sleep(self.window_seconds)
+            with self._lock:
+                del self._pending[key]
+            try:
+                with self._slots:
+                    batch.rows = self._run_batch(key, batch.query_texts, n_results, where, include)
+                if len(batch.query_texts) > 1:
+                    print(f"🔗 SEARCH BATCH: {len(batch.query_texts)} Suchen in einem Chroma-Query")
+            except Exception as e:
+                batch.error = e
+            finally:
+                batch.done.set()
+        else:
+            batch.done.wait()
+
+        if batch.error is not None:
+            raise batch.error
+
+        return batch.rows[position]
+
+    def _run_batch(self, key, query_texts: list, n_results: int, where: dict | None, include: list) -> list:
+        """
+        Executes one batch, answering semantic cache hits without a Chroma search.
+
+        Args:
+            key (tuple): Batch/cache key (n_results, where, include)
+            query_texts (list): Query texts of the batch
+            n_results (int): Number of results
+            where (dict | None): Chroma where filter
+            include (list): Result fields to include
+
+        Returns:
+            list: One single-query result dict per query text (same order)
+        """
+        if self.query_cache is None:
+            results = self.collection.query(
+                query_texts=query_texts,
+                n_results=n_results,
+                where=where,
+                include=include,
+            )
+            return self._split_rows(results, len(query_texts))
+
+        # Ein Embedding-Request für den ganzen Batch, dann Cache-Lookup pro Query
+        embeddings = self.embedding_function(query_texts)
+        rows = [self.query_cache.get_similar(key, embedding) for embedding in embeddings]
+        misses = [i for i, row in enumerate(rows) if row is None]
+
+        if len(misses) < len(rows):
+            print(f"⚡ SEARCH CACHE: {len(rows) - len(misses)} semantische(r) Treffer")
+
+        if misses:
+            results = self.collection.query(
+                query_embeddings=[embeddings[i] for i in misses],
+                n_results=n_results,
+                where=where,
+                include=include,
+            )
+            for i, row in zip(misses, self._split_rows(results, len(misses))):
+                rows[i] = row
+                self.query_cache.add(key, query_texts[i], embeddings[i], row)
+
+        return rows
+
+    @classmethod
+    def _split_rows(cls, results: dict, count: int) -> list:
+        """
+        Splits a multi-query collection.query result into single-query results.
+
+        Args:
+            results (dict): collection.query result for count query texts/embeddings
+            count (int): Number of queries in the result
+
+        Returns:
+            list: count dicts, each shaped like a single-query result
+        """
+        return [
+            {
+                field: [values[position]]
+                for field in cls._RESULT_FIELDS
+                if (values := results.get(field)) is not None
+            }
+            for position in range(count)
+        ]
+
+
 class SearchToolFactory:
     """Enhanced Search Tool Factory with extended error handling for LLM feedback"""
 
@@ -13,12 +187,40 @@ class SearchToolFactory:
         # ≥85%: High quality (Ada-002 Cross-Lingual Performance)
     }
 
+    # Max. gleichzeitige Chroma-Abfragen (inkl. Query-Embedding) bei parallelen Tool-Calls
+    MAX_CONCURRENT_SEARCHES = 4
+
+    # Sammelfenster (Sekunden), in dem parallele Suchen zu einem Query gebündelt werden
+    SEARCH_BATCH_WINDOW = 0.015
+
     @staticmethod
-    def create_search_tool(collection):
-        """Creates Search Tool with enhanced error handling for LLMs"""
+    def create_search_tool(collection, embedding_function=None, query_cache=None):
+        """
+        Creates Search Tool with enhanced error handling for LLMs
+
+        Args:
+            collection (Any): ChromaDB collection to search
+            embedding_function (Any | None): Query embedding function, enables the
+                semantic query cache. Defaults to None
+            query_cache (SemanticQueryCache | None): Cache for repeated/similar
+                queries (process-wide, shared by all sessions). Defaults to None
+
+        Returns:
+            FunctionTool: search_customer_feedback tool
+        """
+
+        # Thread-basiert statt asyncio: jede Streamlit-Session nutzt einen eigenen
+        # Event-Loop, die Abfragen laufen in Worker-Threads
+        batcher = SearchBatcher(
+            collection,
+            window_seconds=SearchToolFactory.SEARCH_BATCH_WINDOW,
+            max_concurrent=SearchToolFactory.MAX_CONCURRENT_SEARCHES,
+            embedding_function=embedding_function,
+            query_cache=query_cache,
+        )
 
         @function_tool
-        def search_customer_feedback(
+        async def search_customer_feedback(
             query: str,
             max_results: int = 10,
             market_filter: str | None = None,
@@ -139,6 +341,13 @@ class SearchToolFactory:
                 - Too many filters may result in empty results
                 - Semantic search operates AFTER metadata filtering
                 - Topic "Sonstiges" contains feedbacks without specific keywords
+                - Async: the blocking Chroma query runs in a worker thread, so
+                  parallel tool calls of one model turn overlap (max.
+                  MAX_CONCURRENT_SEARCHES at a time)
+                - Parallel searches with identical filters are coalesced into one
+                  collection.query call (SearchBatcher)
+                - With a query cache, identical queries skip embedding and search,
+                  semantically equivalent ones skip the Chroma search
             """
             print(f"🔍 SEARCH TOOL: query='{query}', max_results={max_results}")
             print(f"   📊 Filter: market={market_filter}, region={region_filter}, country={country_filter}")
@@ -188,11 +397,9 @@ class SearchToolFactory:
 
             # Date range filters
             if date_from or date_to:
-                from datetime import datetime
-                
                 if date_from:
                     try:
-                        date_from_obj = datetime.strptime(date_from, "%Y-%m-%d")
+                        date_from_obj = datetime.strptime(date_from, "%Y-%m-%d").replace(tzinfo=timezone.utc)
                         timestamp_from = int(date_from_obj.timestamp())
                         filter_list.append({"date": {"$gte": timestamp_from}})
                         print(f"   ⏰ Date From: {date_from} → timestamp {timestamp_from}")
@@ -201,7 +408,7 @@ class SearchToolFactory:
                 
                 if date_to:
                     try:
-                        date_to_obj = datetime.strptime(date_to, "%Y-%m-%d")
+                        date_to_obj = datetime.strptime(date_to, "%Y-%m-%d").replace(tzinfo=timezone.utc)
                         # Set to end of day (23:59:59)
                         timestamp_to = int(date_to_obj.timestamp()) + 86399
                         filter_list.append({"date": {"$lte": timestamp_to}})
@@ -220,8 +427,11 @@ class SearchToolFactory:
             print(f"   🔧 WHERE Filter: {where_filter}")
 
             try:
-                results = collection.query(
-                    query_texts=[query],
+                # Embedding-Request + HNSW-Suche blockieren → im Worker-Thread ausführen,
+                # parallele Suchen mit gleichem Filter werden gebündelt
+                results = await asyncio.to_thread(
+                    batcher.query,
+                    query_text=query,
                     n_results=max_results,
                     where=where_filter,
                     include=["documents", "metadatas", "distances"],
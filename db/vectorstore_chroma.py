@@ -1,12 +1,21 @@
 import os
+import uuid
 import shutil
+import threading
+import random
+import sqlite3
+import asyncio
+import hashlib
+import itertools
+import numpy as np
 import pandas as pd
 import chromadb
 
-from typing import Any, cast
-from datetime import datetime
+from typing import Any, Iterator, cast
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
 from langchain_text_splitters import RecursiveCharacterTextSplitter
 from chromadb.utils import embedding_functions
+from openai import AsyncAzureOpenAI, AsyncOpenAI, RateLimitError
 from db.vectorstore import VectorStore
 
 
@@ -28,7 +37,7 @@ class ChromaVectorStore(VectorStore):
       → Only for extreme outliers, high overlap ensures context preservation
     
     Metadata per Document:
-    - row_id: Row ID in DataFrame
+    - row_id: Row position in DataFrame (0..n-1, independent of the index type)
     - nps: Net Promoter Score (0-10)
     - nps_category: Detractor/Passive/Promoter
     - market: Market ID (e.g. "C1-DE")
@@ -43,37 +52,185 @@ class ChromaVectorStore(VectorStore):
     - verbatim_token_count: Token count of feedback
     - chunk_index: Index of current chunk
     - total_chunks: Total number of chunks for this feedback
-    - verbatim_preview: First 100 characters (for debugging)
+    - verbatim_preview: First 100 characters (only with store_preview=True;
+      the full chunk text is stored as the document anyway)
+
+    Document IDs:
+    - 16 hex characters encoding (row_id << 6) | chunk_index, zero-padded
+      (e.g. row 5, chunk 0 → "0000000000000140")
     """
 
+    # Optionale Metadaten-Spalten, gruppiert nach Zieltyp
+    # (region/country werden aus Market abgeleitet, siehe _precompute_market_columns)
+    _OPTIONAL_STR_COLUMNS = (
+        "nps_category",
+        "sentiment_label",
+        "topic",
+    )
+    _OPTIONAL_FLOAT_COLUMNS = ("sentiment_score", "topic_confidence")
+    _OPTIONAL_INT_COLUMNS = ("verbatim_token_count",)
+
+    # Von ChromaDB akzeptierte Metadaten-Typen
+    _PRIMITIVE_TYPES = (str, int, float, bool)
+
+    # HNSW-Graph explizit festgelegt (unabhängig von Chroma-Default-Änderungen):
+    # M=16 / construction_ef=100 → guter Recall bei kleinem Index,
+    # search_ef=10 → minimale Traversierung (hnswlib nutzt intern max(ef, k))
+    _HNSW_INDEX_SETTINGS = {
+        "hnsw:M": 16,
+        "hnsw:construction_ef": 100,
+        "hnsw:search_ef": 10,
+    }
+
+    # HNSW-Einstellungen für den Bulk-Ingest: Index-Updates in größeren Batches
+    # (Graph-Parameter siehe _HNSW_INDEX_SETTINGS → gleiche Recall).
+    # Die Werte bleiben dauerhaft in den Collection-Metadaten: sync_threshold
+    # bleibt daher beim Chroma-Default (1000, muss ≥ batch_size sein), damit der
+    # Index auch bei kleinen Datensätzen regelmäßig auf Disk geschrieben wird
+    _HNSW_BULK_SETTINGS = {
+        "hnsw:batch_size": 1_000,
+        "hnsw:sync_threshold": 1_000,
+    }
+
+    # Max. gleichzeitige Embedding-Requests beim Erstellen des Stores
+    _EMBEDDING_CONCURRENCY = 8
+    # Texte pro Embedding-Request (API-Limit: 2048 Inputs / 300k Tokens;
+    # 512 Feedbacks à ~120 Zeichen bleiben weit unter dem Token-Limit)
+    _EMBEDDING_REQUEST_SIZE = 512
+    # Retries bei 429 (Rate Limit) mit exponentiellem Backoff + Jitter
+    _EMBEDDING_MAX_RETRIES = 6
+    _EMBEDDING_BACKOFF_BASE = 1.0
+    _EMBEDDING_BACKOFF_MAX = 60.0
+    # Obergrenze des Embedding-Caches (~6 KB pro Ada-002-Vektor → ~1,2 GB);
+    # darüber werden die ältesten Einträge verdrängt
+    _EMBEDDING_CACHE_MAX_ROWS = 200_000
+
+    # Semantische Trennzeichen für RecursiveCharacterTextSplitter
+    _SEPARATORS = [
+        "\n\n",
+        ".\n",
+        ". ",
+        "! ",
+        "? ",
+        ";\n",
+        "; ",
+        ",\n",
+        " - ",
+        " ",
+        "",
+    ]
+
+    # Chunking-Schwellen (siehe _get_optimized_chunk_params)
+    _MIN_CONTENT_CHARS = 10
+    _NO_CHUNKING_MAX_CHARS = 4000
+    _OUTLIER_CHUNK_SIZE = 3000
+    _OUTLIER_CHUNK_OVERLAP = 600
+    # Chunk-Index belegt 6 Bit der Chunk-ID (siehe _make_chunk_id)
+    _MAX_CHUNKS_PER_ROW = 64
+
+    # Version des Metadaten-Schemas (Collection-Metadatum "schema_version");
+    # Stores mit anderer/fehlender Version werden neu aufgebaut
+    # 2: "date" als UTC-Timestamp (vorher lokale Zeit des Build-Hosts)
+    _METADATA_SCHEMA_VERSION = 2
+
+    # Ab dieser Zeilenzahl lohnt sich der Start eines Prozess-Pools fürs Chunking
+    _PARALLEL_CHUNKING_MIN_ROWS = 20_000
+
+    # Spalten mit wenigen eindeutigen Werten → pd.Categorical (int-Codes + Lookup)
+    _CATEGORICAL_COLUMNS = (
+        "Market",
+        "region",
+        "country",
+        "nps_category",
+        "sentiment_label",
+        "topic",
+    )
+
     def __init__(
         self,
         data: pd.DataFrame,
         file_path: str = ".",
         file_name: str = "vectorstore",
         collection_name: str = "customer_feedback",
-        batch_size: int = 100,
+        batch_size: int = 5000,
         embedding_model: str = "text-embedding-ada-002",  # Ada-002: Superior Cross-Lingual (92% avg)
+        validate_metadata: bool = False,
+        chunk_workers: int | None = None,
+        use_embedding_cache: bool = False,
+        store_preview: bool = False,
     ) -> None:
         super().__init__(
             data, file_path, file_name, collection_name, batch_size, embedding_model
         )
 
+        # Slow-Path: Metadaten zusätzlich durch _validate_metadata_types schicken
+        # (nur zum Debuggen nötig, _prepare_metadata erzeugt bereits gültige Typen)
+        self.validate_metadata = validate_metadata
+
+        # verbatim_preview-Metadatum (Debugging) nur auf Wunsch speichern
+        self.store_preview = store_preview
+
+        # Prozesse fürs parallele Chunking (None = os.cpu_count())
+        self.chunk_workers = chunk_workers
+        # Position der ersten Zeile von self.data (≠ 0 nur in Worker-Shards)
+        self._row_offset = 0
+
+        # Optionaler Embedding-Cache (SHA-256 des Textes → Vektor) neben dem Store,
+        # damit force_recreate (rmtree auf persist_directory) ihn nicht mitlöscht;
+        # entfernen über delete_embedding_cache()
+        self.use_embedding_cache = use_embedding_cache
+        self.embedding_cache_path = os.path.join(
+            self.file_path, f"{self.file_name}_emb_cache.sqlite3"
+        )
+
+        # Kategorische Spalten einmalig konvertieren (weniger Speicher,
+        # schnellere notna()/astype(str) Operationen im Metadaten-Prelude)
+        self.data = self.data.astype(
+            {
+                col: "category"
+                for col in self._CATEGORICAL_COLUMNS
+                if col in self.data.columns
+            }
+        )
+
         self._ensure_persist_directory()
         self._chroma_client = chromadb.PersistentClient(path=self.persist_directory)
-        self._embedding_function = self._create_embedding_function()
+        # Lazy: wird erst beim ersten Zugriff auf embedding_function erstellt
+        self._embedding_function = None
 
-    def _create_embedding_function(self):
+    @property
+    def embedding_function(self):
+        """
+        OpenAI embedding function, created on first access.
+
+        Returns:
+            embedding_functions.OpenAIEmbeddingFunction: Cached embedding function
+
+        Notes:
+            - Avoids OpenAI client setup and credential checks for code paths
+              that never load or create a collection
+        """
+        if self._embedding_function is None:
+            self._embedding_function = self.create_embedding_function(self.embedding_model)
+        return self._embedding_function
+
+    @classmethod
+    def create_embedding_function(cls, embedding_model: str = "text-embedding-ada-002"):
         """
         Creates OpenAI Embedding Function - supports both Azure and standard OpenAI.
 
+        Args:
+            embedding_model (str): OpenAI embedding model (Azure: deployment name).
+                Defaults to "text-embedding-ada-002"
+
         Returns:
             embedding_functions.OpenAIEmbeddingFunction: Embedding function instance
             
         Notes:
             - Prioritizes Azure OpenAI if AZURE_OPENAI_ENDPOINT is configured
             - Falls back to standard OpenAI API if Azure is not available
-            - Uses text-embedding-ada-002 model for embeddings
+            - Classmethod: also used for query-time embeddings outside the
+              store (semantic query cache of the search tool)
         """
         # Prüfe zuerst auf Azure OpenAI
         azure_api_key = os.getenv("AZURE_OPENAI_API_KEY")
@@ -91,8 +248,8 @@ class ChromaVectorStore(VectorStore):
                 api_base=azure_endpoint,
                 api_type="azure",
                 api_version=azure_api_version,
-                deployment_id=self.embedding_model,
-                dimensions=self._MODEL_DIMENSIONS.get(self.embedding_model, 384),
+                deployment_id=embedding_model,
+                dimensions=cls._MODEL_DIMENSIONS.get(embedding_model, 384),
             )
         
         # Fallback zu Standard OpenAI
@@ -100,14 +257,207 @@ class ChromaVectorStore(VectorStore):
             print("✅ Verwende Standard OpenAI für Embeddings")
             return embedding_functions.OpenAIEmbeddingFunction(
                 api_key=openai_api_key,
-                model_name=self.embedding_model,
-                dimensions=self._MODEL_DIMENSIONS.get(self.embedding_model, 384),
+                model_name=embedding_model,
+                dimensions=cls._MODEL_DIMENSIONS.get(embedding_model, 384),
             )
         
         # Keine gültigen API Keys gefunden
         else:
             raise ValueError("Weder AZURE_OPENAI_API_KEY+AZURE_OPENAI_ENDPOINT noch OPENAI_API_KEY Umgebungsvariablen sind gesetzt")
 
+    def _create_async_embedding_client(self) -> AsyncOpenAI | AsyncAzureOpenAI:
+        """
+        Creates an async OpenAI client for batch embedding during ingest.
+
+        Returns:
+            AsyncOpenAI | AsyncAzureOpenAI: Client matching the configuration
+                used by create_embedding_function()
+
+        Raises:
+            ValueError: If neither Azure OpenAI nor OpenAI credentials are set
+        """
+        azure_api_key = os.getenv("AZURE_OPENAI_API_KEY")
+        azure_endpoint = os.getenv("AZURE_OPENAI_ENDPOINT") or os.getenv("OPENAI_API_BASE")
+        azure_api_version = os.getenv("AZURE_OPENAI_API_VERSION", "2024-02-01")
+        openai_api_key = os.getenv("OPENAI_API_KEY")
+
+        if azure_api_key and azure_endpoint:
+            return AsyncAzureOpenAI(
+                api_key=azure_api_key,
+                azure_endpoint=azure_endpoint,
+                api_version=azure_api_version,
+            )
+        elif openai_api_key:
+            return AsyncOpenAI(api_key=openai_api_key)
+        else:
+            raise ValueError("Weder AZURE_OPENAI_API_KEY+AZURE_OPENAI_ENDPOINT noch OPENAI_API_KEY Umgebungsvariablen sind gesetzt")
+
+    async def _embed_batch_async(self, texts: list[str]) -> list[list[float]]:
+        """
+        Embeds texts with concurrent OpenAI requests (one per _EMBEDDING_REQUEST_SIZE slice).
+
+        Args:
+            texts (list[str]): Documents to embed
+
+        Returns:
+            list[list[float]]: Embeddings in the same order as texts
+
+        Notes:
+            - Large request slices collapse N HTTP roundtrips into
+              N / _EMBEDDING_REQUEST_SIZE, independent of Chroma's batch_size
+            - asyncio.Semaphore caps in-flight requests at _EMBEDDING_CONCURRENCY
+            - RateLimitError (429) is retried up to _EMBEDDING_MAX_RETRIES times
+              with exponential backoff and full jitter; the semaphore slot is
+              released while waiting so other slices keep going
+            - Replaces ChromaDB's sequential embedding_function calls during
+              ingest; the collection keeps its embedding_function for queries
+        """
+        client = self._create_async_embedding_client()
+        semaphore = asyncio.Semaphore(self._EMBEDDING_CONCURRENCY)
+        request_size = self._EMBEDDING_REQUEST_SIZE
+
+        # "dimensions" wird nur von text-embedding-3-* unterstützt
+        extra_params = {}
+        if self.embedding_model.startswith("text-embedding-3"):
+            extra_params["dimensions"] = self._MODEL_DIMENSIONS[self.embedding_model]
+
+        async def embed_slice(batch: list[str]) -> list[list[float]]:
+            for attempt in range(self._EMBEDDING_MAX_RETRIES + 1):
+                try:
+                    async with semaphore:
+                        response = await client.embeddings.create(
+                            model=self.embedding_model, input=batch, **extra_params
+                        )
+                    break
+                except RateLimitError:
+                    if attempt == self._EMBEDDING_MAX_RETRIES:
+                        raise
+                    # Exponentieller Backoff mit Full Jitter
+                    delay = min(
+                        self._EMBEDDING_BACKOFF_MAX,
+                        self._EMBEDDING_BACKOFF_BASE * 2**attempt,
+                    )
+                    await asyncio.sleep(random.uniform(0, delay))
+            return [item.embedding for item in sorted(response.data, key=lambda d: d.index)]
+
+        try:
+            results = await asyncio.gather(
+                *(
+                    embed_slice(texts[i : i + request_size])
+                    for i in range(0, len(texts), request_size)
+                )
+            )
+        finally:
+            await client.close()
+
+        return [embedding for batch in results for embedding in batch]
+
+    def _open_embedding_cache(self) -> sqlite3.Connection | None:
+        """
+        Opens (and creates if needed) the on-disk embedding cache.
+
+        Returns:
+            sqlite3.Connection | None: Cache connection, or None if disabled/unavailable
+
+        Notes:
+            - Schema: (hash BLOB, model TEXT, dim INT, vec BLOB), keyed by (hash, model)
+            - Stored outside persist_directory so it survives force_recreate;
+              delete_embedding_cache() removes it
+            - Opt-in via use_embedding_cache=True
+        """
+        if not self.use_embedding_cache:
+            return None
+
+        try:
+            conn = sqlite3.connect(self.embedding_cache_path)
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache ("
+                "hash BLOB NOT NULL, model TEXT NOT NULL, dim INTEGER NOT NULL, "
+                "vec BLOB NOT NULL, PRIMARY KEY (hash, model))"
+            )
+            return conn
+        except sqlite3.Error as e:
+            print(f"⚠️ Embedding-Cache nicht verfügbar, embedde ohne Cache: {e}")
+            return None
+
+    def _embed_with_cache(
+        self, texts: list[str], cache: sqlite3.Connection | None
+    ) -> tuple[list[list[float]], int]:
+        """
+        Embeds texts once per distinct text, serving known texts from the cache.
+
+        Args:
+            texts (list[str]): Documents to embed
+            cache (sqlite3.Connection | None): Open cache from _open_embedding_cache
+
+        Returns:
+            tuple[list[list[float]], int]: (embeddings in the same order as texts,
+                number of texts actually sent to the API)
+
+        Notes:
+            - Identical texts ("Keine Angabe", template answers, ...) are
+              embedded once and the vector is reused for every copy
+            - Cache key is SHA-256(text) plus the embedding model name
+            - Only cache misses are sent to the API (_embed_batch_async)
+            - Vectors are stored as float32 bytes
+            - The cache is capped at _EMBEDDING_CACHE_MAX_ROWS; the oldest
+              entries (lowest rowid) are evicted first
+        """
+        # Exakte Duplikate im Fenster zusammenfassen
+        unique_texts = list(dict.fromkeys(texts))
+        embeddings_by_text: dict[str, list[float]] = {}
+
+        hashes = {}
+        if cache is not None:
+            hashes = {
+                text: hashlib.sha256(text.encode("utf-8")).digest()
+                for text in unique_texts
+            }
+            texts_by_hash = {h: text for text, h in hashes.items()}
+
+            # Treffer in einer Abfrage pro 500 Hashes holen
+            unique_hashes = list(texts_by_hash)
+            for i in range(0, len(unique_hashes), 500):
+                part = unique_hashes[i : i + 500]
+                placeholders = ",".join("?" * len(part))
+                rows = cache.execute(
+                    f"SELECT hash, vec FROM cache WHERE model = ? AND hash IN ({placeholders})",
+                    [self.embedding_model, *part],
+                )
+                for h, vec in rows:
+                    embeddings_by_text[texts_by_hash[h]] = np.frombuffer(
+                        vec, dtype=np.float32
+                    ).tolist()
+
+        # Nur unbekannte, eindeutige Texte an die API schicken
+        misses = [text for text in unique_texts if text not in embeddings_by_text]
+        if misses:
+            miss_embeddings = asyncio.run(self._embed_batch_async(misses))
+            embeddings_by_text.update(zip(misses, miss_embeddings))
+
+            if cache is not None:
+                rows = []
+                for text, embedding in zip(misses, miss_embeddings):
+                    vec = np.asarray(embedding, dtype=np.float32)
+                    rows.append(
+                        (hashes[text], self.embedding_model, len(vec), vec.tobytes())
+                    )
+                cache.executemany(
+                    "INSERT OR REPLACE INTO cache VALUES (?, ?, ?, ?)", rows
+                )
+                # INSERT OR REPLACE vergibt neue rowids → kleinste rowid = ältester Eintrag
+                (row_count,) = cache.execute("SELECT COUNT(*) FROM cache").fetchone()
+                excess = row_count - self._EMBEDDING_CACHE_MAX_ROWS
+                if excess > 0:
+                    cache.execute(
+                        "DELETE FROM cache WHERE rowid IN "
+                        "(SELECT rowid FROM cache ORDER BY rowid LIMIT ?)",
+                        (excess,),
+                    )
+                cache.commit()
+
+        return [embeddings_by_text[text] for text in texts], len(misses)
+
     def _ensure_persist_directory(self) -> None:
         """
         Creates persist directory and verifies write permissions.
@@ -117,21 +467,14 @@ class ChromaVectorStore(VectorStore):
             
         Notes:
             - Creates directory recursively if it doesn't exist
-            - Verifies write access with temporary test file
+            - Verifies write access via os.access (no test file I/O)
             - Ensures reliable persistent storage for ChromaDB
         """
         os.makedirs(self.persist_directory, exist_ok=True)
 
-        # Schreibrechte testen
-        test_file = os.path.join(self.persist_directory, ".write_test")
-        try:
-            with open(test_file, "w") as f:
-                f.write("test")
-            os.remove(test_file)
-        except (PermissionError, OSError) as e:
-            raise PermissionError(
-                f"Keine Schreibrechte: {self.persist_directory}"
-            ) from e
+        # Schreibrechte prüfen (ein access()-Syscall statt Test-Datei schreiben)
+        if not os.access(self.persist_directory, os.W_OK | os.X_OK):
+            raise PermissionError(f"Keine Schreibrechte: {self.persist_directory}")
 
     def _get_optimized_chunk_params(self, text_length: int) -> tuple[int, int]:
         """
@@ -165,129 +508,249 @@ class ChromaVectorStore(VectorStore):
             - Chunking only activates for exceptional outliers
             - Large chunk_size preserves context and semantic meaning
         """
-        if text_length < 4000:
+        if text_length < self._NO_CHUNKING_MAX_CHARS:
             # KEIN Chunking: Feedback bleibt vollständig (99.9% der Fälle)
             return (text_length, 0)
         else:
             # Nur bei extremen Ausreißern: Große Chunks mit hohem Overlap
             # 3000 Zeichen ≈ 750 Tokens, 600 Overlap ≈ 150 Tokens (20%)
-            return (3000, 600)
+            return (self._OUTLIER_CHUNK_SIZE, self._OUTLIER_CHUNK_OVERLAP)
 
-    def _prepare_content(self, row: pd.Series) -> str:
+    def _get_text_splitter(
+        self, chunk_size: int, overlap: int
+    ) -> RecursiveCharacterTextSplitter:
         """
-        Prepares pure feedback text for embedding.
-        
+        Returns a cached text splitter for the given chunk parameters.
+
         Args:
-            row (pd.Series): DataFrame row containing feedback data
+            chunk_size (int): Maximum chunk size in characters
+            overlap (int): Overlap between chunks in characters
+
+        Returns:
+            RecursiveCharacterTextSplitter: Splitter reused across rows
+
+        Notes:
+            - _get_optimized_chunk_params only yields a handful of distinct
+              parameter pairs for texts that actually need splitting, so the
+              cache stays tiny
+        """
+        key = (chunk_size, overlap)
+        splitter = self._text_splitters.get(key)
+        if splitter is None:
+            splitter = RecursiveCharacterTextSplitter(
+                chunk_size=chunk_size,
+                chunk_overlap=overlap,
+                separators=self._SEPARATORS,
+                length_function=len,
+            )
+            self._text_splitters[key] = splitter
+        return splitter
+
+    def _prepare_contents(self) -> tuple[list[str], np.ndarray]:
+        """
+        Prepares pure feedback texts for embedding (vectorized over all rows).
             
         Returns:
-            str: Cleaned verbatim text ready for embedding
+            tuple[list[str], np.ndarray]: (contents, lengths) where:
+                - contents: Cleaned verbatim texts ready for embedding
+                - lengths: Character length of each cleaned text
             
         Notes:
-            - Extracts 'verbatim' column from row
+            - Extracts 'Verbatim' column once for the whole DataFrame
             - Converts to string and strips whitespace
-            - Returns empty string if verbatim is missing
+            - Missing verbatims become "" and are filtered as too short
+        """
+        contents = self.data["Verbatim"].astype("string").fillna("").str.strip()
+        return contents.tolist(), contents.str.len().to_numpy(dtype=np.int64)
+
+    def _parse_date_column(self) -> None:
         """
-        return str(row["Verbatim"]).strip()
+        Parses the Date column once for all rows (vectorized).
+
+        Notes:
+            - pd.to_datetime parses in C instead of per-row
+              fromisoformat/strptime calls with try/except
+            - Values are interpreted as UTC ("+00:00" suffix of ISO dates)
+            - Unparseable dates keep only date_str (no "date" timestamp)
+            - Results are stored positionally for _prepare_metadata
+        """
+        if "Date" not in self.data.columns:
+            self._date_str = None
+            self._date_notna = None
+            self._date_valid = None
+            self._date_unix = None
+            return
+
+        raw_dates = self.data["Date"]
+        dates = pd.to_datetime(raw_dates, errors="coerce", utc=True, format="mixed")
+
+        self._date_notna = raw_dates.notna().to_numpy()
+        self._date_valid = dates.notna().to_numpy()
+        self._date_unix = (
+            dates.dt.tz_convert(None).to_numpy(dtype="datetime64[s]").astype("int64")
+        )
+        self._date_str = raw_dates.astype(str).tolist()
+
+    def _precompute_market_columns(self) -> None:
+        """
+        Derives market, region and country for all rows from the Market column.
+
+        Notes:
+            - Market has the structure "<REGION>-<COUNTRY>" (e.g. "C1-DE"), so
+              region/country are parsed with one vectorized split instead of
+              reading three columns per row
+            - Same rules as PrepareCustomerData.split_market_column(): first part is
+              the region, last part the country, "UNKNOWN" if no dash is found
+              (region and country "UNKNOWN" for missing markets)
+        """
+        market = self.data["Market"].astype("string").fillna("").str.strip()
+        parts = market.str.split("-")
+
+        self._market_values = market.tolist()
+        self._region_values = (
+            parts.str[0]
+            .str.strip()
+            .str.upper()
+            .where(market.str.len() > 0, "UNKNOWN")
+            .tolist()
+        )
+        self._country_values = (
+            parts.str[-1]
+            .str.strip()
+            .str.upper()
+            .where(parts.str.len() > 1, "UNKNOWN")
+            .tolist()
+        )
+
+    def _precompute_optional_columns(self) -> None:
+        """
+        Precomputes presence, values and NaN masks of optional metadata columns.
+
+        Notes:
+            - Column presence is checked once per DataFrame instead of per row
+            - Values and notna masks are extracted as NumPy arrays so that
+              _prepare_metadata only needs positional bit checks
+        """
+        columns = self.data.columns
+        self._present_str_columns = tuple(
+            col for col in self._OPTIONAL_STR_COLUMNS if col in columns
+        )
+        self._present_float_columns = tuple(
+            col for col in self._OPTIONAL_FLOAT_COLUMNS if col in columns
+        )
+        self._present_int_columns = tuple(
+            col for col in self._OPTIONAL_INT_COLUMNS if col in columns
+        )
+
+        present_columns = (
+            self._present_str_columns
+            + self._present_float_columns
+            + self._present_int_columns
+        )
+        # String-Spalten einmal (auf Kategorie-Ebene) nach str konvertieren
+        self._optional_values = {
+            col: self.data[col].astype(str).tolist()
+            for col in self._present_str_columns
+        }
+        self._optional_values.update(
+            {
+                col: self.data[col].to_numpy()
+                for col in self._present_float_columns + self._present_int_columns
+            }
+        )
+        self._optional_notna = {
+            col: self.data[col].notna().to_numpy() for col in present_columns
+        }
 
     def _prepare_metadata(
-        self, row: pd.Series, idx: int, chunk_idx: int, total_chunks: int
+        self,
+        idx: int,
+        chunk_idx: int,
+        total_chunks: int,
+        position: int,
+        content: str,
     ) -> dict:
         """
         Prepares comprehensive metadata for ChromaDB.
         
         Args:
-            row (pd.Series): DataFrame row containing feedback data
             idx (int): Row index
             chunk_idx (int): Index of current chunk
             total_chunks (int): Total number of chunks
+            position (int): Positional row index into the precomputed column arrays
+            content (str): Already prepared verbatim text (see _prepare_content)
         
         Returns:
             dict: Validated metadata with the following keys:
-                - row_id, nps, market (always present)
-                - region, country (if Market was split)
+                - row_id, nps, market, region, country (always present,
+                  region/country parsed from Market)
                 - nps_category (if classified)
                 - sentiment_label, sentiment_score (if analyzed)
                 - topic, topic_confidence (if classified)
                 - date, date_str (if available)
                 - verbatim_token_count (if calculated)
                 - chunk_index, total_chunks (chunking info)
-                - verbatim_preview (first 100 characters)
+                - verbatim_preview (first 100 characters, if store_preview)
         
         Notes:
-            - All values are validated for ChromaDB-compatible types
-              (str, int, float, bool)
+            - All values are constructed with ChromaDB-compatible types
+              (str, int, float, bool); _validate_metadata_types only runs
+              when validate_metadata=True
             - Handles numpy types and None values appropriately
             - Ensures robust metadata storage for filtering
+            - Reads only precomputed column arrays (no pandas row access);
+              requires the preludes in _iter_chunks to have run
         """
         # Sichere Datentyp-Konvertierungen
         metadata = {
             "row_id": int(idx),
-            "nps": int(float(row["NPS"])),  # Handle object type via float conversion
-            "market": str(row["Market"]).strip(),
+            "nps": int(float(self._nps_values[position])),  # Handle object type via float conversion
+            "market": self._market_values[position],
+            "region": self._region_values[position],
+            "country": self._country_values[position],
             "chunk_index": int(chunk_idx),
             "total_chunks": int(total_chunks),
         }
 
         # Optional: Date als Unix Timestamp für ChromaDB-Filterung
-        if "Date" in row.index and pd.notna(row["Date"]):
-            try:
-                date_str = str(row["Date"])
-                # Handle ISO format with timezone
-                if "T" in date_str and "+00:00" in date_str:
-                    date_obj = datetime.fromisoformat(date_str.replace("+00:00", ""))
-                else:
-                    # Fallback to standard format
-                    date_obj = datetime.strptime(date_str, "%Y-%m-%d %H:%M:%S")
-                metadata["date"] = int(date_obj.timestamp())
-                metadata["date_str"] = date_str
-            except (ValueError, TypeError):
-                metadata["date_str"] = str(row["Date"])
-
-        # Optional: NPS Category
-        if "nps_category" in row.index and pd.notna(row["nps_category"]):
-            metadata["nps_category"] = str(row["nps_category"])
-
-        # Optional: Sentiment
-        if "sentiment_label" in row.index and pd.notna(row["sentiment_label"]):
-            metadata["sentiment_label"] = str(row["sentiment_label"])
-
-        if "sentiment_score" in row.index and pd.notna(row["sentiment_score"]):
-            try:
-                metadata["sentiment_score"] = float(row["sentiment_score"])
-            except (ValueError, TypeError):
-                # Fallback für ungültige Sentiment-Werte
-                metadata["sentiment_score"] = 0.0
+        # (vorab vektorisiert geparst in _parse_date_column)
+        if self._date_str is not None and self._date_notna[position]:
+            if self._date_valid[position]:
+                metadata["date"] = int(self._date_unix[position])
+            metadata["date_str"] = self._date_str[position]
+
+        # Optional: Kategorische Felder (nps_category, sentiment_label, topic)
+        # - Präsenz und NaN-Masken vorab berechnet
+        values = self._optional_values
+        notna = self._optional_notna
+        for col in self._present_str_columns:
+            if notna[col][position]:
+                metadata[col] = values[col][position]
+
+        # Optional: Scores (sentiment_score, topic_confidence)
+        for col in self._present_float_columns:
+            if notna[col][position]:
+                try:
+                    metadata[col] = float(values[col][position])
+                except (ValueError, TypeError):
+                    # Fallback für ungültige Score-Werte
+                    metadata[col] = 0.0
 
         # Optional: Token Count
-        if "verbatim_token_count" in row.index and pd.notna(
-            row["verbatim_token_count"]
-        ):
-            metadata["verbatim_token_count"] = int(row["verbatim_token_count"])
-
-        # Optional: Topic Classification
-        if "topic" in row.index and pd.notna(row["topic"]):
-            metadata["topic"] = str(row["topic"])
-
-        if "topic_confidence" in row.index and pd.notna(row["topic_confidence"]):
-            try:
-                metadata["topic_confidence"] = float(row["topic_confidence"])
-            except (ValueError, TypeError):
-                metadata["topic_confidence"] = 0.0
-
-        # Optional: Region (from Market split)
-        if "region" in row.index and pd.notna(row["region"]):
-            metadata["region"] = str(row["region"])
-
-        # Optional: Country (ISO format from Market split)
-        if "country" in row.index and pd.notna(row["country"]):
-            metadata["country"] = str(row["country"])
+        for col in self._present_int_columns:
+            if notna[col][position]:
+                metadata[col] = int(values[col][position])
 
         # Hilfreich für Debugging: Preview des Original-Feedbacks
-        metadata["verbatim_preview"] = str(row["Verbatim"])[:100]
+        # (redundant zum Dokument selbst, daher standardmäßig aus)
+        if self.store_preview:
+            metadata["verbatim_preview"] = content[:100]
 
-        # ChromaDB Metadata-Typ-Validierung
-        return self._validate_metadata_types(metadata)
+        # Alle Werte sind bereits per int()/float()/str() typisiert;
+        # ChromaDB Metadata-Typ-Validierung nur auf expliziten Wunsch
+        if self.validate_metadata:
+            return self._validate_metadata_types(metadata)
+        return metadata
 
     def _validate_metadata_types(self, metadata: dict) -> dict:
         """
@@ -305,108 +768,370 @@ class ChromaVectorStore(VectorStore):
             - Filters out None values
             - Handles edge cases like NaN and inf
         """
-        validated = {}
-        for key, value in metadata.items():
-            if value is None:
-                continue
-            elif isinstance(value, (str, int, float, bool)):
-                validated[key] = value
-            elif isinstance(value, (list, dict)):
-                # Komplexe Typen zu String konvertieren
-                validated[key] = str(value)
-            else:
-                # Alle anderen Typen zu String
-                validated[key] = str(value)
-        return validated
+        # Ein Durchlauf ohne Verzweigungskette: Primitive bleiben, Rest → str
+        return {
+            key: value if isinstance(value, self._PRIMITIVE_TYPES) else str(value)
+            for key, value in metadata.items()
+            if value is not None
+        }
 
-    def split_and_chunk_text(self) -> tuple[list[str], list[dict], list[str]]:
+    @classmethod
+    def _make_chunk_id(cls, row_index: int, chunk_idx: int) -> str:
         """
-        Splits and chunks feedback texts with optimized parameters.
+        Encodes (row_index, chunk_idx) as a fixed-length integer chunk ID.
+
+        Args:
+            row_index (int): Row ID (same value as metadata["row_id"])
+            chunk_idx (int): Index of the chunk within the row (< _MAX_CHUNKS_PER_ROW)
 
         Returns:
-            tuple[list[str], list[dict], list[str]]: Three-element tuple containing:
-                - documents (list[str]): List of content texts (chunks)
-                - metadatas (list[dict]): List of metadata dicts per chunk
-                - ids (list[str]): List of unique IDs per chunk (format: "doc_{idx}_{chunk_idx}")
-                
+            str: 16 hex characters of (row_index << 6) | chunk_idx, zero-padded
+
         Raises:
-            ValueError: If no valid documents could be created from DataFrame
-            
+            ValueError: If chunk_idx does not fit into the 6 chunk bits
+
         Notes:
-            - Filters out feedbacks <10 characters (too short)
-            - 99.9% of feedbacks remain unchunked (<4000 chars)
-            - Uses RecursiveCharacterTextSplitter with semantic separators
-            - Preserves full metadata from original row for each chunk
-            - Prints detailed chunking statistics to console
-            - Token estimation: 1 token ≈ 4 characters for German text
+            - Zero-padded keys share a uniform prefix, so SQLite's TEXT B-tree
+              comparisons behave like integer compares
+            - IDs are reversible: row_index = int(id, 16) >> 6
+            - 64 chunks per feedback ≈ 150k characters (3000/600 chunking);
+              real outliers stay far below that
         """
-        documents = []
-        metadatas = []
-        ids = []
-
-        separators = [
-            "\n\n",
-            ".\n",
-            ". ",
-            "! ",
-            "? ",
-            ";\n",
-            "; ",
-            ",\n",
-            " - ",
-            " ",
-            "",
-        ]
+        if chunk_idx >= cls._MAX_CHUNKS_PER_ROW:
+            raise ValueError(f"Zu viele Chunks für ID-Encoding: {chunk_idx}")
+        return f"{(row_index << 6) | chunk_idx:016x}"
 
-        for idx, row in self.data.iterrows():
-            try:
-                # Sichere Index-Konvertierung für Type-Safety
-                row_index = int(idx) if isinstance(idx, (int, str)) else hash(idx)
-
-                # 1. Content vorbereiten (NUR Verbatim!)
-                content = self._prepare_content(row)
+    def _iter_chunks(
+        self,
+        contents: list[str],
+        lengths: np.ndarray,
+        errors: list[tuple[Any, str]],
+    ) -> Iterator[tuple[str, dict, str]]:
+        """
+        Lazily chunks all rows of self.data and prepares their metadata.
 
-                if not content or len(content) < 10:
-                    continue
+        Args:
+            contents (list[str]): Prepared verbatim texts (see _prepare_contents)
+            lengths (np.ndarray): Character length of each content
+            errors (list[tuple[Any, str]]): Receives (row index, repr(exception))
+                for rows that failed
 
-                # 2. Optimierte Chunk-Parameter ermitteln
-                chunk_size, overlap = self._get_optimized_chunk_params(len(content))
+        Yields:
+            tuple[str, dict, str]: (document, metadata, id) per chunk in row order
 
-                # 3. Text-Splitter mit optimierten Parametern
-                text_splitter = RecursiveCharacterTextSplitter(
-                    chunk_size=chunk_size,
-                    chunk_overlap=overlap,
-                    separators=separators,
-                    length_function=len,
-                )
+        Notes:
+            - Only touches self.data and chunking/metadata helpers, so it can
+              run on DataFrame shards inside worker processes (_chunk_shard)
+            - Length filter and split decision are computed once as NumPy masks;
+              the loop only visits rows that survive the filter
+            - Rows with more than _MAX_CHUNKS_PER_ROW chunks are skipped as a
+              whole and reported in errors (no partial rows)
+        """
+        self._parse_date_column()
+        self._precompute_market_columns()
+        self._precompute_optional_columns()
+        self._nps_values = self.data["NPS"].to_numpy()
+        self._text_splitters = {}
+
+        # Filter (zu kurz) und Split-Entscheidung einmal vektorisiert statt
+        # pro Zeile; nur Ausreißer brauchen überhaupt einen Text-Splitter
+        valid_positions = np.flatnonzero(lengths >= self._MIN_CONTENT_CHARS).tolist()
+        split_positions = set(
+            np.flatnonzero(lengths >= self._NO_CHUNKING_MAX_CHARS).tolist()
+        )
+        index_values = self.data.index.tolist()
 
-                chunks = text_splitter.split_text(content)
+        # Positionaler Zugriff auf vorab extrahierte Spalten statt iterrows()
+        # (kein Series-Boxing pro Zeile)
+        for position in valid_positions:
+            idx = index_values[position]
+            try:
+                # Row-ID = globale Zeilenposition: deterministisch über Läufe
+                # hinweg (kein randomisiertes hash() für Nicht-Int-Indizes)
+                row_index = self._row_offset + position
+
+                # content wird an Chunking und Metadaten durchgereicht
+                content = contents[position]
+
+                # Passt der Text in einen Chunk, liefert der Splitter ohnehin
+                # [content] zurück
+                if position in split_positions:
+                    chunk_size, overlap = self._get_optimized_chunk_params(
+                        int(lengths[position])
+                    )
+                    chunks = self._get_text_splitter(chunk_size, overlap).split_text(
+                        content
+                    )
+                else:
+                    chunks = [content]
                 total_chunks = len(chunks)
 
+                # Vor dem ersten yield prüfen: sonst wären die ersten 64 Chunks
+                # bereits gespeichert, bevor die Zeile als Fehler zählt
+                if total_chunks > self._MAX_CHUNKS_PER_ROW:
+                    raise ValueError(
+                        f"Zu viele Chunks für ID-Encoding: {total_chunks} "
+                        f"(max. {self._MAX_CHUNKS_PER_ROW})"
+                    )
+
                 # 4. Chunks und Metadaten erstellen
                 for chunk_idx, chunk in enumerate(chunks):
                     # Metadaten vorbereiten
                     metadata = self._prepare_metadata(
-                        row, row_index, chunk_idx, total_chunks
+                        row_index, chunk_idx, total_chunks, position, content
                     )
 
-                    # Zu ChromaDB hinzufügen
-                    documents.append(chunk)
-                    metadatas.append(metadata)
-                    ids.append(f"doc_{idx}_{chunk_idx}")
+                    yield chunk, metadata, self._make_chunk_id(row_index, chunk_idx)
 
             except Exception as e:
-                print(f"Warnung: Fehler beim Verarbeiten von Zeile {idx}: {e}")
+                # Kein print pro Zeile - Zusammenfassung nach der Schleife
+                errors.append((idx, repr(e)))
                 continue
 
-        if not documents:
-            raise ValueError(
-                "Keine Dokumente konnten aus dem DataFrame erstellt werden"
+    def _chunk_rows(
+        self,
+    ) -> tuple[
+        list[str], list[dict], list[str], list[tuple[Any, str]], tuple[int, int]
+    ]:
+        """
+        Chunks all rows of self.data into lists (serial).
+
+        Returns:
+            tuple[list[str], list[dict], list[str], list[tuple[Any, str]], tuple[int, int]]:
+                (documents, metadatas, ids, errors, stats) where errors holds
+                (row index, repr(exception)) for rows that failed and stats is
+                (processed_count, total_chars), accumulated during the loop
+        """
+        # 1. Content vorbereiten (NUR Verbatim!) - einmal für alle Zeilen
+        contents, lengths = self._prepare_contents()
+
+        # Ausgabelisten vorab dimensionieren: 99.9% der Feedbacks ergeben genau
+        # einen Chunk, Mehr-Chunk-Zeilen werden hinten angehängt
+        n_slots = int(np.count_nonzero(lengths >= self._MIN_CONTENT_CHARS))
+        documents = [None] * n_slots
+        metadatas = [None] * n_slots
+        ids = [None] * n_slots
+        errors = []
+        out_i = 0
+        processed_count = 0
+        total_chars = 0
+
+        for chunk, metadata, chunk_id in self._iter_chunks(contents, lengths, errors):
+            if out_i < n_slots:
+                documents[out_i] = chunk
+                metadatas[out_i] = metadata
+                ids[out_i] = chunk_id
+            else:
+                documents.append(chunk)
+                metadatas.append(metadata)
+                ids.append(chunk_id)
+            out_i += 1
+
+            # Statistiken im selben Durchlauf statt nachträglicher Sweeps
+            total_chars += len(chunk)
+            if metadata["chunk_index"] == 0:
+                processed_count += 1
+
+        # Unbenutzte Slots (fehlerhafte Zeilen) abschneiden
+        del documents[out_i:], metadatas[out_i:], ids[out_i:]
+
+        return documents, metadatas, ids, errors, (processed_count, total_chars)
+
+    @staticmethod
+    def _metadata_to_columns(metadatas: list[dict]) -> dict[str, list]:
+        """
+        Converts per-chunk metadata dicts into one list per metadata field.
+
+        Args:
+            metadatas (list[dict]): Metadata dicts (fields may be missing)
+
+        Returns:
+            dict[str, list]: Field name → values, None where a chunk lacks the field
+
+        Notes:
+            - Columnar layout pickles far smaller than N dicts with repeated keys
+            - Inverse of _iter_metadata_rows
+        """
+        columns: dict[str, list] = {}
+        for position, metadata in enumerate(metadatas):
+            for key, value in metadata.items():
+                column = columns.get(key)
+                if column is None:
+                    column = columns[key] = [None] * len(metadatas)
+                column[position] = value
+        return columns
+
+    @staticmethod
+    def _iter_metadata_rows(columns: dict[str, list]) -> Iterator[dict]:
+        """
+        Lazily rebuilds metadata dicts from columnar metadata.
+
+        Args:
+            columns (dict[str, list]): Output of _metadata_to_columns
+
+        Yields:
+            dict: Metadata dict per chunk (None fields omitted, as in _prepare_metadata)
+        """
+        keys = list(columns)
+        for values in zip(*columns.values()):
+            yield {key: value for key, value in zip(keys, values) if value is not None}
+
+    def _chunk_rows_parallel(
+        self, n_workers: int
+    ) -> tuple[
+        list[str], dict[str, list], list[str], list[tuple[Any, str]], tuple[int, int]
+    ]:
+        """
+        Chunks self.data in row shards across worker processes.
+
+        Args:
+            n_workers (int): Number of worker processes (= number of shards)
+
+        Returns:
+            tuple[list[str], dict[str, list], list[str], list[tuple[Any, str]], tuple[int, int]]:
+                (documents, metadata_columns, ids, errors, stats) in original row
+                order; metadata_columns is columnar (see _metadata_to_columns),
+                stats is (processed_count, total_chars) summed over all shards
+
+        Notes:
+            - Only the columns needed for content/metadata are pickled to workers
+            - Each shard gets its start position as row offset (row_id, ids unchanged)
+            - Metadata stays columnar; dicts are only rebuilt per ingest window
+        """
+        needed_columns = [
+            col
+            for col in (
+                ("Verbatim", "NPS", "Market", "Date")
+                + self._OPTIONAL_STR_COLUMNS
+                + self._OPTIONAL_FLOAT_COLUMNS
+                + self._OPTIONAL_INT_COLUMNS
+            )
+            if col in self.data.columns
+        ]
+        data = self.data[needed_columns]
+
+        shard_size = -(-len(data) // n_workers)  # Aufrunden
+        shards = [
+            data.iloc[start : start + shard_size]
+            for start in range(0, len(data), shard_size)
+        ]
+
+        documents = []
+        metadata_columns: dict[str, list] = {}
+        ids = []
+        errors = []
+        processed_count = 0
+        total_chars = 0
+
+        with ProcessPoolExecutor(max_workers=n_workers) as executor:
+            results = executor.map(
+                _chunk_shard,
+                shards,
+                [self.validate_metadata] * len(shards),
+                [self.store_preview] * len(shards),
+                range(0, len(data), shard_size),
             )
+            for (
+                shard_documents,
+                shard_columns,
+                shard_ids,
+                shard_errors,
+                (shard_processed, shard_chars),
+            ) in results:
+                # Spalten zusammenführen; Felder, die in einem Shard fehlen,
+                # werden mit None aufgefüllt
+                offset = len(documents)
+                for key in shard_columns:
+                    metadata_columns.setdefault(key, [None] * offset)
+                for key, values in metadata_columns.items():
+                    values.extend(
+                        shard_columns.get(key) or [None] * len(shard_documents)
+                    )
+
+                documents.extend(shard_documents)
+                ids.extend(shard_ids)
+                errors.extend(shard_errors)
+                processed_count += shard_processed
+                total_chars += shard_chars
+
+        return documents, metadata_columns, ids, errors, (processed_count, total_chars)
+
+    def _parallel_chunking_workers(self) -> int:
+        """
+        Decides whether chunking runs in parallel worker processes.
+
+        Returns:
+            int: Number of worker processes, or 0 for serial chunking
+
+        Notes:
+            - Parallel only for >= _PARALLEL_CHUNKING_MIN_ROWS rows, smaller
+              datasets do not amortize the process pool startup
+        """
+        n_workers = self.chunk_workers or os.cpu_count() or 1
+        if n_workers > 1 and len(self.data) >= self._PARALLEL_CHUNKING_MIN_ROWS:
+            return n_workers
+        return 0
+
+    def _iter_all_chunks(
+        self, errors: list[tuple[Any, str]]
+    ) -> Iterator[tuple[str, dict, str]]:
+        """
+        Yields (document, metadata, id) for all rows, serial or parallel.
 
-        # Detaillierte Statistiken ausgeben
+        Args:
+            errors (list[tuple[Any, str]]): Receives failed rows
+
+        Yields:
+            tuple[str, dict, str]: (document, metadata, id) in row order
+
+        Notes:
+            - Serial path streams chunks lazily (no full document lists)
+            - Parallel path has to materialize the worker results first, but
+              keeps metadata columnar and builds dicts only as they are consumed
+        """
+        n_workers = self._parallel_chunking_workers()
+        if n_workers:
+            print(f"⚙️  Chunking parallel in {n_workers} Prozessen...")
+            documents, metadata_columns, ids, shard_errors, _ = (
+                self._chunk_rows_parallel(n_workers)
+            )
+            errors.extend(shard_errors)
+            yield from zip(documents, self._iter_metadata_rows(metadata_columns), ids)
+        else:
+            contents, lengths = self._prepare_contents()
+            yield from self._iter_chunks(contents, lengths, errors)
+
+    @staticmethod
+    def _print_chunking_errors(errors: list[tuple[Any, str]]) -> None:
+        """
+        Prints a summary of rows that failed during chunking.
+
+        Args:
+            errors (list[tuple[Any, str]]): (row index, repr(exception)) tuples
+        """
+        # Fehlerhafte Zeilen gesammelt melden (statt einer Ausgabe pro Zeile)
+        if errors:
+            print(f"⚠️ Warnung: {len(errors):,} Zeilen konnten nicht verarbeitet werden")
+            for idx, error in errors[:10]:
+                print(f"   • Zeile {idx}: {error}")
+            if len(errors) > 10:
+                print(f"   ... und {len(errors) - 10:,} weitere")
+
+    def _print_chunking_stats(
+        self, processed_count: int, chunk_count: int, total_chars: int
+    ) -> None:
+        """
+        Prints chunking statistics.
+
+        Args:
+            processed_count (int): Number of feedbacks that produced chunks
+            chunk_count (int): Number of created chunks
+            total_chars (int): Total characters over all chunks
+
+        Notes:
+            - Token estimation: 1 token ≈ 4 characters for German text
+        """
         original_count = len(self.data)
-        processed_count = len(set([m["row_id"] for m in metadatas]))
         filtered_count = original_count - processed_count
 
         print(f"\n{'=' * 60}")
@@ -415,17 +1140,60 @@ class ChromaVectorStore(VectorStore):
         print(f"📥 Original CSV-Einträge: {original_count:,}")
         print(f"✅ Verarbeitete Feedbacks: {processed_count:,}")
         print(f"🚫 Gefilterte Einträge: {filtered_count:,} (zu kurz: <10 Zeichen)")
-        print(f"📄 Erstellte Chunks: {len(documents):,}")
+        print(f"📄 Erstellte Chunks: {chunk_count:,}")
         print(
-            f"📊 Durchschnitt: {len(documents) / processed_count:.2f} Chunks/Feedback"
+            f"📊 Durchschnitt: {chunk_count / processed_count:.2f} Chunks/Feedback"
         )
 
         # Token-Schätzung (1 Token ≈ 4 Zeichen für Deutsch)
-        total_chars = sum(len(doc) for doc in documents)
         estimated_tokens = total_chars // 4
         print(f"🔤 Geschätzte Tokens: {estimated_tokens:,}")
         print(f"{'=' * 60}\n")
 
+    def split_and_chunk_text(self) -> tuple[list[str], list[dict], list[str]]:
+        """
+        Splits and chunks feedback texts with optimized parameters.
+
+        Returns:
+            tuple[list[str], list[dict], list[str]]: Three-element tuple containing:
+                - documents (list[str]): List of content texts (chunks)
+                - metadatas (list[dict]): List of metadata dicts per chunk
+                - ids (list[str]): List of unique IDs per chunk (16-hex of (row_id << 6) | chunk_idx)
+                
+        Raises:
+            ValueError: If no valid documents could be created from DataFrame
+            
+        Notes:
+            - Filters out feedbacks <10 characters (too short)
+            - 99.9% of feedbacks remain unchunked (<4000 chars)
+            - Uses RecursiveCharacterTextSplitter with semantic separators
+            - Preserves full metadata from original row for each chunk
+            - Datasets with >= _PARALLEL_CHUNKING_MIN_ROWS rows are chunked in
+              parallel shards (ProcessPoolExecutor, chunk_workers processes)
+            - Prints detailed chunking statistics to console
+            - create_vectorstore() does not use this method; it streams chunks
+              batch-wise via _iter_all_chunks() instead of materializing lists
+        """
+        n_workers = self._parallel_chunking_workers()
+        if n_workers:
+            print(f"⚙️  Chunking parallel in {n_workers} Prozessen...")
+            documents, metadata_columns, ids, errors, stats = (
+                self._chunk_rows_parallel(n_workers)
+            )
+            metadatas = list(self._iter_metadata_rows(metadata_columns))
+        else:
+            documents, metadatas, ids, errors, stats = self._chunk_rows()
+
+        self._print_chunking_errors(errors)
+
+        if not documents:
+            raise ValueError(
+                "Keine Dokumente konnten aus dem DataFrame erstellt werden"
+            )
+
+        processed_count, total_chars = stats
+        self._print_chunking_stats(processed_count, len(documents), total_chars)
+
         return documents, metadatas, ids
 
     def check_file_path(self) -> bool:
@@ -453,6 +1221,91 @@ class ChromaVectorStore(VectorStore):
             else False
         )
 
+    def _create_ingest_collection(self) -> Any:
+        """
+        Creates the collection for a fresh ingest.
+
+        Returns:
+            chromadb.Collection: Empty collection with pinned HNSW settings and
+                the current metadata schema version
+
+        Notes:
+            - Runs on the writer thread of create_vectorstore, like the
+              following upserts
+        """
+        # Collection erstellen mit expliziter Cosine-Metric
+        collection = self._chroma_client.create_collection(
+            name=self.collection_name,
+            embedding_function=cast(Any, self.embedding_function),
+            metadata={
+                "hnsw:space": "cosine",  # Explizit Cosine Distance für OpenAI Embeddings
+                "schema_version": self._METADATA_SCHEMA_VERSION,
+                **self._HNSW_INDEX_SETTINGS,
+                **self._HNSW_BULK_SETTINGS,
+            },
+        )
+
+        return collection
+
+    @classmethod
+    def _has_current_schema(cls, collection: Any) -> bool:
+        """
+        Checks whether a collection was built with the current metadata schema.
+
+        Args:
+            collection (chromadb.Collection): Existing collection
+
+        Returns:
+            bool: True if its "schema_version" matches _METADATA_SCHEMA_VERSION
+
+        Notes:
+            - Stores built before versioning have no schema_version and hold
+              "date" in the build host's local time, so UTC date filters would
+              be shifted by the UTC offset
+        """
+        metadata = getattr(collection, "metadata", None) or {}
+        return metadata.get("schema_version") == cls._METADATA_SCHEMA_VERSION
+
+    @staticmethod
+    def _upsert_window(
+        collection: Any,
+        documents: list[str],
+        metadatas: list[dict],
+        ids: list[str],
+        embeddings: list[list[float]],
+        add_batch_size: int,
+        batch_num: int,
+        chunk_offset: int,
+    ) -> None:
+        """
+        Upserts one embedded ingest window in add_batch_size batches.
+
+        Args:
+            collection: Target ChromaDB collection
+            documents (list[str]): Chunk texts of the window
+            metadatas (list[dict]): Metadata per chunk
+            ids (list[str]): Chunk IDs
+            embeddings (list[list[float]]): Precomputed embeddings
+            add_batch_size (int): Max. chunks per upsert call
+            batch_num (int): Number of batches written before this window
+            chunk_offset (int): Number of chunks written before this window
+        """
+        # Batch-Processing für große Datenmengen
+        for i in range(0, len(documents), add_batch_size):
+            end_idx = min(i + add_batch_size, len(documents))
+            batch_num += 1
+
+            print(f"⏳ Verarbeite Batch {batch_num} ({chunk_offset + end_idx:,} Chunks)...")
+
+            # upsert: deterministische IDs, Wiederholungen überschreiben
+            # statt mit Duplicate-ID-Fehlern abzubrechen
+            collection.upsert(
+                embeddings=embeddings[i:end_idx],  # type: ignore[arg-type]
+                documents=documents[i:end_idx],
+                metadatas=metadatas[i:end_idx],  # type: ignore[arg-type]
+                ids=ids[i:end_idx],
+            )
+
     def create_vectorstore(self, force_recreate: bool = False) -> Any | None:
         """
         Creates or loads VectorStore with feedback-optimized chunking.
@@ -470,10 +1323,23 @@ class ChromaVectorStore(VectorStore):
             
         Notes:
             - Loads existing collection if available (unless force_recreate=True)
+            - Existing collections with an outdated metadata schema version
+              (_has_current_schema) are deleted and rebuilt
             - Creates new collection with cosine distance metric
-            - Uses batch processing for large datasets (configurable batch_size)
-            - Explicitly persists collection to disk via client restart
-            - Verifies persistence by reloading collection
+            - Fuses chunking, embedding and insert: chunks are produced in
+              windows of _EMBEDDING_REQUEST_SIZE * _EMBEDDING_CONCURRENCY, embedded with
+              concurrent async OpenAI requests and upserted in batch_size batches
+              (capped at the client's max batch size)
+            - HNSW graph parameters are pinned (_HNSW_INDEX_SETTINGS)
+            - HNSW index updates are batched (_HNSW_BULK_SETTINGS); the index
+              is still persisted every 1000 items
+            - Upserts run on a single writer thread, overlapping the write of
+              one window with the embedding of the next
+            - Embeddings are cached on disk by SHA-256(text), so force_recreate
+              only pays for texts that changed (opt-in: use_embedding_cache=True)
+            - The collection keeps its embedding_function for query-time embedding
+            - Relies on PersistentClient writing synchronously (ChromaDB >= 0.4)
+            - Verifies persistence via collection.count() on the existing handle
             - Prints detailed progress and statistics to console
         """
         # Wenn force_recreate=True, lösche komplett und erstelle neu
@@ -487,12 +1353,7 @@ class ChromaVectorStore(VectorStore):
             self._chroma_client = chromadb.PersistentClient(path=self.persist_directory)
 
         # Check ob Store existiert (nach potenziellem Löschen)
-        store_exists = False
-        temp_collections = self._chroma_client.list_collections()
-        if len(temp_collections) > 0:
-            for temp_collection in temp_collections:
-                if temp_collection.name == self.collection_name:
-                    store_exists = True
+        store_exists = self.collection_name in self._existing_collection_names()
 
         # Existierenden Store laden (nur wenn nicht force_recreate)
         if store_exists and not force_recreate:
@@ -500,72 +1361,134 @@ class ChromaVectorStore(VectorStore):
             try:
                 collection = self._chroma_client.get_collection(
                     name=self.collection_name,
-                    embedding_function=cast(Any, self._embedding_function),
+                    embedding_function=cast(Any, self.embedding_function),
                 )
-                print(f"✓ VectorStore geladen mit {collection.count()} Dokumenten")
-                return collection
             except Exception as e:
                 print(f"❌ Fehler beim Laden: {e}")
                 return None
 
+            if self._has_current_schema(collection):
+                print(f"✓ VectorStore geladen mit {collection.count()} Dokumenten")
+                return collection
+
+            # Veraltetes Schema (z.B. Datum in lokaler Zeit) → wie force_recreate
+            print("\n⚠️ VectorStore-Schema veraltet - lösche und erstelle neu...")
+            if not self.delete_vectorstore():
+                print("⚠️ Warnung: VectorStore konnte nicht vollständig gelöscht werden")
+            self._chroma_client = chromadb.PersistentClient(path=self.persist_directory)
+
         # Neuen Store erstellen
         print("\n🔨 Erstelle neuen VectorStore...")
 
         try:
-            # Dokumente vorbereiten
-            documents, metadatas, ids = self.split_and_chunk_text()
-
-            # Collection erstellen mit expliziter Cosine-Metric
-            collection = self._chroma_client.create_collection(
-                name=self.collection_name,
-                embedding_function=cast(Any, self._embedding_function),
-                metadata={"hnsw:space": "cosine"}  # Explizit Cosine Distance für OpenAI Embeddings
-            )
+            # Chunking, Embedding und Insert in einem Durchgang: Chunks werden
+            # fensterweise erzeugt, parallel embedded und direkt eingefügt,
+            # statt alle Dokumente vorher in Listen zu halten
+            errors = []
+            chunk_stream = self._iter_all_chunks(errors)
+            window_size = self._EMBEDDING_REQUEST_SIZE * self._EMBEDDING_CONCURRENCY
+
+            # Chroma lehnt Batches über dem Server-Limit ab (~5461 bei SQLite)
+            add_batch_size = self.batch_size
+            get_max_batch_size = getattr(self._chroma_client, "get_max_batch_size", None)
+            if get_max_batch_size is not None:
+                add_batch_size = min(add_batch_size, get_max_batch_size())
+
+            collection = None
+            embedding_cache = self._open_embedding_cache()
+            processed_count = 0
+            api_embedded_count = 0
+            chunk_count = 0
+            total_chars = 0
+            batch_num = 0
+
+            # Alle Schreibzugriffe (Collection, Upserts) laufen in einem
+            # Writer-Thread: das Upsert von Fenster k überlappt mit dem
+            # Embedding von Fenster k+1, SQLite sieht nur eine Verbindung
+            writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="chroma-writer")
+            pending_write: Future | None = None
+
+            try:
+                while True:
+                    window = list(itertools.islice(chunk_stream, window_size))
+                    if not window:
+                        break
+
+                    documents, metadatas, ids = (list(col) for col in zip(*window))
+
+                    if collection is None:
+                        collection = writer.submit(
+                            self._create_ingest_collection
+                        ).result()
+
+                    # Embeddings für das Fenster parallel berechnen (Duplikate
+                    # und Cache-Treffer werden nicht erneut an die API geschickt)
+                    embeddings, embedded_count = self._embed_with_cache(
+                        documents, embedding_cache
+                    )
+                    api_embedded_count += embedded_count
+
+                    # Backpressure: höchstens ein Fenster wartet aufs Schreiben
+                    if pending_write is not None:
+                        pending_write.result()
+                    pending_write = writer.submit(
+                        self._upsert_window,
+                        collection,
+                        documents,
+                        metadatas,
+                        ids,
+                        embeddings,
+                        add_batch_size,
+                        batch_num,
+                        chunk_count,
+                    )
+                    batch_num += -(-len(documents) // add_batch_size)  # Aufrunden
 
-            # Batch-Processing für große Datenmengen
-            total_docs = len(documents)
-            for i in range(0, total_docs, self.batch_size):
-                end_idx = min(i + self.batch_size, total_docs)
-                batch_num = (i // self.batch_size) + 1
-                total_batches = (total_docs + self.batch_size - 1) // self.batch_size
+                    # Laufende Statistiken
+                    chunk_count += len(documents)
+                    total_chars += sum(len(doc) for doc in documents)
+                    processed_count += sum(
+                        1 for metadata in metadatas if metadata["chunk_index"] == 0
+                    )
 
-                print(f"⏳ Verarbeite Batch {batch_num}/{total_batches}...")
+                if pending_write is not None:
+                    pending_write.result()
+            finally:
+                # Bei Abbruch laufendes Upsert abwarten, ohne dessen Fehler
+                # über die ursprüngliche Exception zu legen
+                if pending_write is not None:
+                    wait([pending_write])
+                writer.shutdown(wait=True)
+                if embedding_cache is not None:
+                    embedding_cache.close()
+
+            self._print_chunking_errors(errors)
+
+            if collection is None:
+                raise ValueError(
+                    "Keine Dokumente konnten aus dem DataFrame erstellt werden"
+                )
 
-                batch_documents = documents[i:end_idx]
-                batch_metadatas = metadatas[i:end_idx]
-                batch_ids = ids[i:end_idx]
+            self._print_chunking_stats(processed_count, chunk_count, total_chars)
 
-                collection.add(
-                    documents=batch_documents,
-                    metadatas=batch_metadatas,  # type: ignore[arg-type]
-                    ids=batch_ids,
+            reused_count = chunk_count - api_embedded_count
+            if reused_count:
+                print(
+                    f"♻️ Embeddings: {api_embedded_count:,} per API, "
+                    f"{reused_count:,} wiederverwendet (Duplikate/Cache)"
                 )
 
-            # ✅ KRITISCH: Explizit persistieren (ChromaDB schreibt sonst nicht auf Disk!)
-            # ChromaDB PersistentClient sollte automatisch persistieren, aber...
-            # in manchen Versionen/Setups muss man den Client explizit schließen
-            print("\n💾 Persistiere Collection auf Disk...")
-            
-            # Erzwinge Persist durch Client-Neustart
-            # Dies stellt sicher dass alle Daten auf Disk geschrieben werden
-            old_client = self._chroma_client
-            self._chroma_client = chromadb.PersistentClient(path=self.persist_directory)
-            
-            # Verifiziere dass Collection jetzt persistent ist
-            collections = self._chroma_client.list_collections()
-            if not any(col.name == self.collection_name for col in collections):
+            # PersistentClient schreibt synchron auf Disk (ChromaDB >= 0.4),
+            # ein Client-Neustart zum "Erzwingen" des Persist ist nicht nötig.
+            # Verifikation über den bestehenden Collection-Handle.
+            document_count = collection.count()
+            if document_count == 0:
                 raise RuntimeError("Collection wurde nicht korrekt persistiert!")
-            
-            # Collection neu laden aus persistiertem State
-            collection = self._chroma_client.get_collection(
-                name=self.collection_name,
-                embedding_function=cast(Any, self._embedding_function),
-            )
 
             print(f"\n{'=' * 60}")
             print("✅ VECTORSTORE ERFOLGREICH ERSTELLT")
             print(f"{'=' * 60}")
-            print(f"📊 {collection.count()} Dokumente embedded und gespeichert")
+            print(f"📊 {document_count} Dokumente embedded und gespeichert")
             print(f"📁 Speicherort: {self.persist_directory}")
             print(f"{'=' * 60}\n")
 
@@ -575,6 +1498,116 @@ class ChromaVectorStore(VectorStore):
             print(f"❌ Fehler beim Erstellen: {e}")
             return None
 
+    @classmethod
+    def open_existing(
+        cls,
+        file_path: str = ".",
+        file_name: str = "vectorstore",
+        collection_name: str = "customer_feedback",
+        embedding_model: str = "text-embedding-ada-002",
+    ) -> Any | None:
+        """
+        Opens an existing collection without loading any source data.
+
+        Args:
+            file_path (str): Base directory of the store. Defaults to "."
+            file_name (str): Store directory name below file_path. Defaults to "vectorstore"
+            collection_name (str): Name of the collection. Defaults to "customer_feedback"
+            embedding_model (str): Embedding model of the collection. Defaults to "text-embedding-ada-002"
+
+        Returns:
+            chromadb.Collection | None: Collection with its query embedding function,
+                                        or None if it does not exist/could not be opened
+
+        Notes:
+            - Same result as create_vectorstore() on an existing store, but
+              without the DataFrame the constructor requires (no CSV read or
+              enhancement when the data is not needed)
+            - Returns None for stores with an outdated metadata schema version,
+              so callers load the data and create_vectorstore() rebuilds them
+        """
+        persist_directory = os.path.join(file_path, file_name)
+        # Kein Store-Verzeichnis: nichts zu öffnen (ohne Client anzulegen)
+        if not os.path.isdir(persist_directory):
+            print(f"ℹ️  Kein VectorStore unter {persist_directory} gefunden")
+            return None
+
+        try:
+            client = chromadb.PersistentClient(path=persist_directory)
+            collection = client.get_collection(
+                name=collection_name,
+                embedding_function=cast(Any, cls.create_embedding_function(embedding_model)),
+            )
+            if not cls._has_current_schema(collection):
+                print("⚠️ VectorStore-Schema veraltet - Neuaufbau erforderlich")
+                return None
+            print(f"✓ VectorStore geladen mit {collection.count()} Dokumenten")
+            return collection
+        except Exception as e:
+            print(f"❌ Fehler beim Laden: {e}")
+            return None
+
+    @staticmethod
+    def warm_up(collection: Any, persist_directory: str) -> None:
+        """
+        Moves the cold-start cost of the vector index from the first user query to startup.
+
+        Args:
+            collection (chromadb.Collection): Loaded collection to warm up
+            persist_directory (str): Directory of the persistent store
+
+        Returns:
+            None
+
+        Notes:
+            - Hints the HNSW index files and the SQLite store into the OS page
+              cache (posix_fadvise WILLNEED, sequential read as fallback)
+            - Runs one nearest-neighbour query with a stored embedding, which
+              makes Chroma load the HNSW segment into memory; no embedding
+              API request is made
+            - Failures are only reported, the app works without warm-up
+        """
+        try:
+            for root, _, files in os.walk(persist_directory):
+                for name in files:
+                    if not (name.endswith(".bin") or name.endswith(".sqlite3")):
+                        continue
+                    with open(os.path.join(root, name), "rb") as f:
+                        if hasattr(os, "posix_fadvise"):
+                            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_WILLNEED)
+                        else:
+                            while f.read(1 << 20):
+                                pass
+
+            sample = collection.get(limit=1, include=["embeddings"])
+            embeddings = sample.get("embeddings")
+            if embeddings is not None and len(embeddings) > 0:
+                # Ein Treffer genügt, um das HNSW-Segment zu laden
+                collection.query(
+                    query_embeddings=[embeddings[0]],
+                    n_results=1,
+                    include=["distances"],
+                )
+            print("✓ VectorStore-Index vorgewärmt")
+        except Exception as e:
+            print(f"⚠️ Warm-up des VectorStore fehlgeschlagen: {e}")
+
+    def _existing_collection_names(self) -> set[str]:
+        """
+        Returns the names of all collections in the persistent client.
+
+        Returns:
+            set[str]: Collection names (one list_collections call, O(1) lookups)
+
+        Notes:
+            - ChromaDB 0.6 returns plain names from list_collections, other
+              versions return Collection objects; both are handled
+        """
+        return {
+            getattr(collection, "name", collection)
+            for collection in self._chroma_client.list_collections()
+        }
+
     def delete_vectorstore(self) -> bool:
         """
         Deletes VectorStore completely (collection + persist directory).
@@ -584,8 +1617,12 @@ class ChromaVectorStore(VectorStore):
             
         Notes:
             - Deletes ChromaDB collection from client
-            - Removes entire persist_directory and all contents
+            - Removes entire persist_directory and all contents: the directory
+              is renamed to a trash sibling (O(1)) and deleted in a background
+              thread, falling back to a blocking rmtree if the rename fails
             - Irreversible operation - use with caution
+            - Keeps the embedding cache so force_recreate can reuse it;
+              use delete_embedding_cache() to remove it as well
             - Returns False if any deletion step fails
             - Prints status messages for each step
         """
@@ -593,8 +1630,7 @@ class ChromaVectorStore(VectorStore):
 
         # Collection löschen
         try:
-            collections = self._chroma_client.list_collections()
-            if any(col.name == self.collection_name for col in collections):
+            if self.collection_name in self._existing_collection_names():
                 self._chroma_client.delete_collection(name=self.collection_name)
                 print(f"✓ Collection '{self.collection_name}' gelöscht")
             else:
@@ -606,7 +1642,23 @@ class ChromaVectorStore(VectorStore):
         # Verzeichnis löschen
         try:
             if os.path.exists(self.persist_directory):
-                shutil.rmtree(self.persist_directory)
+                # Atomar umbenennen und im Hintergrund löschen, damit ein
+                # großer HNSW-Index force_recreate nicht blockiert
+                trash_directory = f"{self.persist_directory}.trash-{uuid.uuid4().hex}"
+                try:
+                    os.replace(self.persist_directory, trash_directory)
+                except OSError:
+                    # z.B. gesperrte Dateien unter Windows → blockierend löschen
+                    shutil.rmtree(self.persist_directory)
+                else:
+                    # Kein Daemon-Thread: der Interpreter wartet beim Beenden,
+                    # damit keine halb gelöschten Trash-Verzeichnisse bleiben
+                    threading.Thread(
+                        target=shutil.rmtree,
+                        args=(trash_directory,),
+                        kwargs={"ignore_errors": True},
+                        name="chroma-trash-cleanup",
+                    ).start()
                 print(f"✓ Verzeichnis '{self.persist_directory}' gelöscht")
             else:
                 print(f"ℹ️  Verzeichnis '{self.persist_directory}' existiert nicht")
@@ -615,3 +1667,64 @@ class ChromaVectorStore(VectorStore):
             success = False
 
         return success
+
+    def delete_embedding_cache(self) -> bool:
+        """
+        Deletes the on-disk embedding cache file.
+
+        Returns:
+            bool: True if the cache is gone afterwards, False if deletion failed
+
+        Notes:
+            - Independent of delete_vectorstore, which keeps the cache on purpose
+            - Also removes SQLite side files (-journal, -wal, -shm)
+        """
+        try:
+            for suffix in ("", "-journal", "-wal", "-shm"):
+                path = self.embedding_cache_path + suffix
+                if os.path.exists(path):
+                    os.remove(path)
+            print(f"✓ Embedding-Cache '{self.embedding_cache_path}' gelöscht")
+            return True
+        except OSError as e:
+            print(f"⚠️  Embedding-Cache konnte nicht gelöscht werden: {e}")
+            return False
+
+
+def _chunk_shard(
+    shard: pd.DataFrame, validate_metadata: bool, store_preview: bool, row_offset: int
+) -> tuple[
+    list[str], dict[str, list], list[str], list[tuple[Any, str]], tuple[int, int]
+]:
+    """
+    Worker entry point for parallel chunking of a DataFrame shard.
+
+    Args:
+        shard (pd.DataFrame): Row slice of the feedback DataFrame
+        validate_metadata (bool): Forwarded ChromaVectorStore.validate_metadata
+        store_preview (bool): Forwarded ChromaVectorStore.store_preview
+        row_offset (int): Position of the shard's first row in the full DataFrame
+
+    Returns:
+        tuple[list[str], dict[str, list], list[str], list[tuple[Any, str]], tuple[int, int]]:
+            (documents, metadata_columns, ids, errors, (processed_count, total_chars))
+
+    Notes:
+        - Metadata is returned columnar to keep the pickled result small
+        - Module-level so ProcessPoolExecutor can pickle it
+        - Builds a client-less ChromaVectorStore (no PersistentClient, no
+          embedding function) that only carries the data-side state
+    """
+    chunker = ChromaVectorStore.__new__(ChromaVectorStore)
+    chunker.data = shard
+    chunker.validate_metadata = validate_metadata
+    chunker.store_preview = store_preview
+    chunker._row_offset = row_offset
+    documents, metadatas, ids, errors, stats = chunker._chunk_rows()
+    return (
+        documents,
+        ChromaVectorStore._metadata_to_columns(metadatas),
+        ids,
+        errors,
+        stats,
+    )
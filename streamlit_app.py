@@ -6,15 +6,21 @@ Identical functionality to app.py with clean main() structure.
 
 import streamlit as st
 import os
-from agents import SQLiteSession
+import time
+import asyncio
+from functools import lru_cache
 from dotenv import load_dotenv
 
 from utils.helper_functions import (
     is_azure_openai,
     check_vectorstore_exists,
     extract_all_chart_paths,  # ✅ Für Multi-Chart Support
+    CHART_MARKER_RE,
     process_query_streamed,  # ✅ Echtes Token-Streaming
-    initialize_system
+    process_queries_concurrently,
+    initialize_system,
+    load_system_collection,
+    build_agent_system
 )
 
 # Import chart cleanup utility
@@ -26,12 +32,16 @@ from test.test_questions import TestQuestions
 # Import our simple history manager (for UI display)
 from utils.simple_history import SimpleConversationHistory
 
+# In-memory agent session (replaces SQLiteSession ":memory:")
+from utils.in_memory_session import InMemorySession
+
 # Import modular style components
 from streamlit_styles.header_styles import render_header_section
 from streamlit_styles.footer_styles import render_footer
 from streamlit_styles.layout_styles import apply_main_layout_styles
 from streamlit_styles.sidebar_styles import render_sidebar_content
 
+
 load_dotenv()
 
 # ============================================================================
@@ -52,6 +62,9 @@ VECTORSTORE_TYPE = "chroma"
 VECTORSTORE_PATH = "./chroma"
 VECTORSTORE_COLLECTION_NAME = "feedback_data"
 FORCE_RECREATE_VECTORSTORE = False  # ⚠️ ACHTUNG: True = VectorStore wird IMMER neu erstellt (löscht alte Daten!)
+# Gültigkeit (Sekunden) des gecachten Existenz-Checks: Löschen/Neuaufbau aus
+# main.py oder einem anderen Prozess wird spätestens danach erkannt
+VECTORSTORE_CHECK_TTL_SECONDS = 30
 
 # AZURE OPENAI OR OPENAI - Automatische Erkennung basierend auf Umgebungsvariablen
 IS_AZURE_OPENAI = is_azure_openai()
@@ -62,8 +75,26 @@ IS_AZURE_OPENAI = is_azure_openai()
 # Empfohlen: 3-5 für Balance zwischen Kontext und Token-Kosten
 HISTORY_LIMIT = 4
 
+# HISTORY DISPLAY - Anzahl der zuletzt angezeigten Chat-Turns pro Durchlauf
+# Ältere Turns werden erst auf Knopfdruck gerendert (None = immer alle)
+HISTORY_DISPLAY_WINDOW = 20
+
+# EXAMPLE QUERIES - Maximal gleichzeitige Agent-Runs bei "Alle Beispiele ausführen"
+EXAMPLE_QUERY_CONCURRENCY = 5
+
+# STREAMING - Mindestabstand (Sekunden) zwischen zwei Placeholder-Updates
+# Kleinere Werte = flüssigerer Typewriter-Effekt, mehr Websocket-Nachrichten
+STREAM_RENDER_INTERVAL = 0.05
+# Mindestlänge (Zeichen), ab der gepufferte Tokens sofort weitergegeben werden
+STREAM_FLUSH_CHARS = 64
+
+# Chart-Marker im Stream (CHART_MARKER_RE) werden nicht angezeigt;
+# Zeichen am Pufferende, die ein angefangener Marker sein könnten
+_MARKER_TAIL = len("__CHART__") - 1
+
 # EXAMPLE QUERIES - Strategisch ausgewählte Fragen für maximalen "AHA-Effekt"
-EXAMPLE_QUERIES = [
+# Tuple: statisch, wird beim Import einmal aufgebaut und nie verändert
+EXAMPLE_QUERIES = (
     # 1. META-FRAGE - Zeigt metadata_tool in Aktion (schnelle, präzise Antwort)
     TestQuestions.META_QUESTIONS[1],  # "Wie ist die NPS-Verteilung in deinem Datensatz?"
     
@@ -78,7 +109,14 @@ EXAMPLE_QUERIES = [
     
     # 5. CHART-GENERATION - Zeigt chart_creator_agent für visuelle Insights
     "Erstelle ein Balkendiagramm der Top 5 Themen mit NPS-Scores",
-]
+)
+
+# CHART SIZES - Spalten-Verhältnis [left_margin, center_content, right_margin]
+CHART_SIZE_COLUMNS = {
+    "Klein": (2, 2, 2),   # Schmal in der Mitte
+    "Mittel": (1, 3, 1),  # Standard
+    "Groß": (0, 1, 0),    # Vollbild
+}
 
 # Removed render_native_response and render_structured_summary functions
 # All responses are now handled uniformly with streaming
@@ -86,29 +124,151 @@ EXAMPLE_QUERIES = [
 def ensure_session_initialized():
     """
     Ensures that the session is initialized.
-    Uses in-memory SQLite (:memory:) for non-persistent sessions.
+    Uses a plain in-process session for non-persistent sessions.
     Session exists only during the current browser session.
     
     Returns:
-        SQLiteSession: Initialized session object from st.session_state
+        InMemorySession: Initialized session object from st.session_state
     """
     if "session" not in st.session_state:
-        st.session_state.session = SQLiteSession(
-            "streamlit_feedback_session", 
-            ":memory:"  # In-Memory Datenbank - keine Persistenz
-        )
+        # Keine Persistenz nötig → Liste im Speicher statt SQLite-Roundtrips
+        st.session_state.session = InMemorySession("streamlit_feedback_session")
     return st.session_state.session
 
 
-@st.cache_data(ttl=1)  # Cache for 1 second to reduce multiple calls in same render
+def show_full_history() -> None:
+    """
+    Button callback: renders the complete chat history from the next run on.
+
+    Returns:
+        None
+
+    Notes:
+        - Runs as on_click callback before the rerun, no extra st.rerun() needed
+    """
+    st.session_state.show_full_history = True
+
+
+def ensure_event_loop() -> asyncio.AbstractEventLoop:
+    """
+    Ensures that the browser session owns a persistent asyncio event loop.
+
+    Returns:
+        asyncio.AbstractEventLoop: Event loop stored in st.session_state.event_loop
+
+    Notes:
+        - Replaces asyncio.run per query: keep-alive connections of the async
+          OpenAI client stay bound to one loop and are reused across turns
+        - Set as current loop on every call, reruns may execute in a new thread
+        - Closed loops (e.g. after an error) are replaced transparently
+    """
+    loop = st.session_state.get("event_loop")
+    if loop is None or loop.is_closed():
+        loop = asyncio.new_event_loop()
+        st.session_state.event_loop = loop
+    asyncio.set_event_loop(loop)
+    return loop
+
+
+def run_on_session_loop(coroutine, stream=None):
+    """
+    Runs a coroutine on the session's event loop and cleans up afterwards.
+
+    Args:
+        coroutine (Coroutine): Coroutine to run to completion
+        stream (AsyncGenerator | None): Async generator consumed by the coroutine,
+                                        closed afterwards. Defaults to None
+
+    Returns:
+        Any: Result of the coroutine
+
+    Notes:
+        - Replaces the cleanup asyncio.run did per call: if Streamlit interrupts
+          the run (rerun/stop raised mid-stream), the stream is closed and
+          leftover tasks (e.g. Runner.run_streamed background tasks) are
+          cancelled instead of resuming on the next run_until_complete
+    """
+    loop = ensure_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        if stream is not None:
+            loop.run_until_complete(stream.aclose())
+        pending = [task for task in asyncio.all_tasks(loop) if not task.done()]
+        for task in pending:
+            task.cancel()
+        if pending:
+            loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+
+
 def get_cached_conversation_stats():
     """
-    Cached wrapper for conversation stats to avoid multiple API calls.
-    
+    Session-scoped cache for conversation stats to avoid recomputation per render.
+
     Returns:
         dict: Dictionary containing conversation statistics
+
+    Notes:
+        - Recomputes only when the history changed (new interaction or
+          cleared chat); called once per run in main(), sidebar and
+          footer receive the result as a parameter
+        - Replaces st.cache_data(ttl=1), which hashed on every call and
+          still recomputed once per second
+    """
+    conversation = st.session_state.conversation
+    history = conversation.history
+    cache_key = (
+        conversation.session_id,
+        len(history),
+        history[-1]["timestamp"] if history else None,
+    )
+
+    cached = st.session_state.get("_stats_cache")
+    if cached is None or cached[0] != cache_key:
+        cached = (cache_key, conversation.get_summary_stats())
+        st.session_state._stats_cache = cached
+    return cached[1]
+
+
+@lru_cache(maxsize=256)
+def resolve_chart_path(chart_path: str) -> tuple[str, bool, str]:
+    """
+    Resolves a chart path once per process (charts are write-once files).
+
+    Args:
+        chart_path (str): Relative or absolute path to the chart file
+
+    Returns:
+        tuple[str, bool, str]: (absolute_path, exists, basename)
+
+    Notes:
+        - Avoids abspath/stat calls for every chart on every rerun
+        - Cleared when the chart cleanup deleted files (see main)
+    """
+    # Konvertiere relativen Pfad zu absolutem Pfad
+    absolute_path = os.path.abspath(chart_path)
+    return absolute_path, os.path.exists(absolute_path), os.path.basename(absolute_path)
+
+
+@lru_cache(maxsize=32)
+def load_chart_bytes(absolute_path: str) -> bytes:
     """
-    return st.session_state.conversation.get_summary_stats()
+    Reads a chart PNG once per process (charts are write-once files).
+
+    Args:
+        absolute_path (str): Absolute path of an existing chart file
+
+    Returns:
+        bytes: PNG file content
+
+    Notes:
+        - History replays hand the cached bytes to st.image instead of
+          re-reading every chart from disk on each rerun
+        - Bounded to the 32 most recent charts (~ a few MB)
+        - Cleared together with resolve_chart_path by the chart cleanup
+    """
+    with open(absolute_path, "rb") as chart_file:
+        return chart_file.read()
 
 
 def render_chart(chart_path: str, size: str = "Mittel"):
@@ -122,34 +282,26 @@ def render_chart(chart_path: str, size: str = "Mittel"):
     Returns:
         None
     """
-    # Konvertiere relativen Pfad zu absolutem Pfad
-    if not os.path.isabs(chart_path):
-        chart_path = os.path.abspath(chart_path)
+    chart_path, chart_exists, chart_name = resolve_chart_path(chart_path)
     
-    if not os.path.exists(chart_path):
-        st.warning(f"⚠️ Chart nicht gefunden: {os.path.basename(chart_path)}")
+    if not chart_exists:
+        st.warning(f"⚠️ Chart nicht gefunden: {chart_name}")
         return
     
-    # Größen-Konfiguration: [left_margin, center_content, right_margin]
-    size_config = {
-        "Klein": [2, 2, 2],   # Schmal in der Mitte
-        "Mittel": [1, 3, 1],  # Standard
-        "Groß": [0, 1, 0]     # Vollbild
-    }
-    
-    cols = size_config.get(size, [1, 3, 1])
+    cols = CHART_SIZE_COLUMNS.get(size, CHART_SIZE_COLUMNS["Mittel"])
     
     try:
-        if cols == [0, 1, 0]:
+        chart_bytes = load_chart_bytes(chart_path)
+        if cols == CHART_SIZE_COLUMNS["Groß"]:
             # Vollbild
-            st.image(chart_path, use_container_width=True, 
-                    caption=f"📊 {os.path.basename(chart_path)}")
+            st.image(chart_bytes, use_container_width=True, 
+                    caption=f"📊 {chart_name}")
         else:
             # Mit Margins
             col1, col2, col3 = st.columns(cols)
             with col2:
-                st.image(chart_path, use_container_width=True,
-                        caption=f"📊 {os.path.basename(chart_path)}")
+                st.image(chart_bytes, use_container_width=True,
+                        caption=f"📊 {chart_name}")
     except Exception as e:
         st.error(f"❌ Fehler beim Anzeigen: {e}")
 
@@ -157,46 +309,46 @@ def render_chart(chart_path: str, size: str = "Mittel"):
 async def stream_agent_response(customer_manager, user_input: str, session, history_limit: int):
     """
     Async generator for real token streaming from agent.
-    Streamlit automatically converts async generator to sync!
+    Consumed by render_stream() (coalesced placeholder updates).
     
     Args:
         customer_manager (Any): Customer Manager Agent instance
         user_input (str): User input text
-        session (SQLiteSession): SQLite session object
+        session (InMemorySession): Agent session object
         history_limit (int): History limit for conversation context
     
     Yields:
-        str: Tokens for Streamlit streaming display (WITHOUT chart markers)
+        str: Coalesced text pieces for streaming display (WITHOUT chart markers)
+    
+    Notes:
+        - Tokens are buffered and flushed every STREAM_RENDER_INTERVAL seconds
+          or once STREAM_FLUSH_CHARS characters are ready (fewer generator steps)
+        - Text behind an unfinished __CHART__ marker is held back until the
+          marker is complete, then the marker is dropped
     """
-    import re
-    buffer = ""  # Buffer to check for chart markers
+    buffer = ""  # Buffer to check for chart markers and coalesce tokens
+    last_flush = time.monotonic()
     
     async for chunk in process_query_streamed(customer_manager, user_input, session, history_limit):
         if isinstance(chunk, str):
             # Add chunk to buffer
             buffer += chunk
             
-            # Check if buffer contains complete chart marker
+            # Vollständige Chart-Marker sofort entfernen
             if "__CHART__" in buffer:
-                # Extract text BEFORE chart marker
-                match = re.search(r'(.*?)__CHART__', buffer)
-                if match:
-                    # Yield text before marker
-                    text_before = match.group(1)
-                    if text_before:
-                        yield text_before
-                    
-                    # Remove everything up to and including the closing marker
-                    buffer = re.sub(r'.*?__CHART__.*?__CHART__', '', buffer, count=1)
-                else:
-                    # Incomplete marker, keep buffering
-                    pass
-            elif len(buffer) > 100:
-                # If buffer gets too large without marker, yield it
-                # (keep last 20 chars in case marker is split)
-                yield_text = buffer[:-20]
-                buffer = buffer[-20:]
-                yield yield_text
+                buffer = CHART_MARKER_RE.sub('', buffer)
+            
+            # Ausgabebereiter Teil: alles vor einem offenen Marker bzw. ohne die
+            # letzten Zeichen, die der Anfang eines gesplitteten Markers sein könnten
+            marker_pos = buffer.find("__CHART__")
+            split_at = marker_pos if marker_pos != -1 else max(len(buffer) - _MARKER_TAIL, 0)
+            
+            # Tokens zu Stücken bündeln (Zeitfenster oder Mindestlänge)
+            now = time.monotonic()
+            if split_at and (split_at >= STREAM_FLUSH_CHARS or now - last_flush >= STREAM_RENDER_INTERVAL):
+                yield buffer[:split_at]
+                buffer = buffer[split_at:]
+                last_flush = now
         elif isinstance(chunk, dict):
             # Final result oder Error - speichere für späteren Zugriff
             st.session_state._streaming_final_result = chunk
@@ -204,51 +356,284 @@ async def stream_agent_response(customer_manager, user_input: str, session, hist
     # Yield any remaining buffer (without chart markers)
     if buffer:
         # Remove any chart markers from final buffer
-        clean_buffer = re.sub(r'__CHART__.*?__CHART__', '', buffer)
+        clean_buffer = CHART_MARKER_RE.sub('', buffer)
         if clean_buffer.strip():
             yield clean_buffer
 
 
-@st.cache_resource(show_spinner=False)
+def render_stream(placeholder, chunks) -> str:
+    """
+    Drives an async text stream into a single placeholder with coalesced updates.
+
+    Args:
+        placeholder (Any): st.empty() placeholder to render into
+        chunks (AsyncIterator[str]): Async generator yielding text pieces
+
+    Returns:
+        str: Complete streamed text
+
+    Notes:
+        - Replaces st.write_stream: the placeholder is re-rendered at most
+          every STREAM_RENDER_INTERVAL seconds instead of once per chunk
+        - Final text is always rendered once at the end
+        - Runs on the session's persistent event loop (run_on_session_loop),
+          the stream is closed even if the run is interrupted
+    """
+    async def drive() -> str:
+        parts = []
+        last_render = 0.0
+        async for text in chunks:
+            parts.append(text)
+            now = time.monotonic()
+            if now - last_render >= STREAM_RENDER_INTERVAL:
+                placeholder.markdown("".join(parts) + "▌")
+                last_render = now
+
+        full_text = "".join(parts)
+        placeholder.markdown(full_text)
+        return full_text
+
+    return run_on_session_loop(drive(), stream=chunks)
+
+
+def render_concurrent_queries(queries: list[str], chart_size: str) -> None:
+    """
+    Runs independent queries concurrently and shows each answer as soon as it is ready.
+
+    Args:
+        queries (list[str]): User queries (e.g. all sidebar examples)
+        chart_size (str): Chart size for rendered charts
+
+    Returns:
+        None
+
+    Notes:
+        - At most EXAMPLE_QUERY_CONCURRENCY agent runs are in flight
+        - Each run uses its own agent session (no shared history, no races);
+          afterwards the runs are appended to the main agent session and the
+          answers to the conversation, both in query order
+        - Runs on the session's persistent event loop (run_on_session_loop)
+    """
+    # Alle Turns sofort anzeigen, Antworten landen in ihrem Platzhalter
+    slots = []
+    for query in queries:
+        with st.chat_message("user", avatar="🧑"):
+            st.write(query)
+        with st.chat_message("assistant", avatar="🧠"):
+            container = st.container()
+            placeholder = container.empty()
+            placeholder.markdown("Nachdenken läuft...")
+        slots.append((container, placeholder))
+
+    entries = [None] * len(queries)
+    run_sessions = [None] * len(queries)
+
+    async def drive() -> None:
+        async for index, result, run_session in process_queries_concurrently(
+            st.session_state.customer_manager,
+            queries,
+            max_concurrency=EXAMPLE_QUERY_CONCURRENCY,
+        ):
+            container, placeholder = slots[index]
+            chart_paths = []
+            if isinstance(result, dict) and "error" in result:
+                response_content = f"❌ **ERROR ({result.get('error_type', 'Unknown')}):** {result['error']}"
+                text_content = response_content
+                agent_name_str = "Assistant"
+            else:
+                response_content = str(result.final_output) if result.final_output else ""
+                agent_name_str = result.last_agent.name if result.last_agent else "Assistant"
+                text_content, chart_paths = extract_all_chart_paths(response_content)
+                run_sessions[index] = run_session
+
+            placeholder.markdown(text_content)
+            with container:
+                for chart_path in chart_paths:
+                    render_chart(chart_path, size=chart_size)
+            entries[index] = (response_content, agent_name_str, text_content, chart_paths)
+
+        # Erfolgreiche Runs in Eingabereihenfolge in die Haupt-Session übernehmen,
+        # damit Folgefragen denselben Kontext haben wie nach normalen Turns
+        main_session = ensure_session_initialized()
+        for run_session in run_sessions:
+            if run_session is not None:
+                await main_session.add_items(await run_session.get_items())
+
+    run_on_session_loop(drive())
+
+    for query, entry in zip(queries, entries):
+        if entry is None:
+            continue
+        response_content, agent_name_str, text_content, chart_paths = entry
+        st.session_state.conversation.add_interaction(
+            user_input=query,
+            agent_response=response_content,
+            agent_name=agent_name_str,
+            text=text_content,
+            chart_paths=chart_paths)
+
+
+@st.cache_data(show_spinner=False, ttl=VECTORSTORE_CHECK_TTL_SECONDS)
+def check_vectorstore_exists_cached(vectorstore_path: str, collection_name: str) -> tuple[bool, int]:
+    """
+    Cached check_vectorstore_exists: probes the Chroma directory at most once per TTL.
+
+    Args:
+        vectorstore_path (str): Path to VectorStore directory
+        collection_name (str): Name of the ChromaDB collection
+
+    Returns:
+        tuple[bool, int]: (exists, document_count), see check_vectorstore_exists
+
+    Notes:
+        - Avoids opening a PersistentClient and listing collections per new session
+        - Expires after VECTORSTORE_CHECK_TTL_SECONDS, so changes made by other
+          processes (main.py, a second app instance) are picked up
+        - Must be cleared (check_vectorstore_exists_cached.clear()) after the
+          VectorStore was (re)created in this process
+    """
+    return check_vectorstore_exists(
+        vectorstore_path=vectorstore_path,
+        collection_name=collection_name
+    )
+
+
+# Module, deren Änderung den Agenten-Graphen (nicht die Collection) veraltet macht
+AGENT_MODULE_DIRS = ("customer_agents", "customer_agents_tools")
+
+
+def agent_modules_fingerprint() -> tuple[str, ...]:
+    """
+    Fingerprint of the agent and tool source files (path, mtime, size).
+
+    Returns:
+        tuple[str, ...]: One entry per .py file below AGENT_MODULE_DIRS
+
+    Notes:
+        - Used as cache key of build_agents_cached: editing prompts/tools
+          rebuilds the agents, editing the UI (streamlit_styles, main) does not
+        - Only stats the files, no content hashing
+    """
+    fingerprint = []
+    for directory in AGENT_MODULE_DIRS:
+        for root, _, files in os.walk(directory):
+            for name in sorted(files):
+                if name.endswith(".py"):
+                    stat = os.stat(os.path.join(root, name))
+                    fingerprint.append(f"{root}/{name}:{stat.st_mtime_ns}:{stat.st_size}")
+    return tuple(sorted(fingerprint))
+
+
+@st.cache_resource(show_spinner=False, max_entries=1)
+def load_collection_cached(is_azure_openai: bool=False, csv_path: str=FILE_PATH_CSV, is_synthetic: bool=False):
+    """
+    Cached load_system_collection: one OpenAI client and Chroma handle per process.
+
+    Args:
+        is_azure_openai (bool): If True uses Azure OpenAI, if False uses standard OpenAI. Defaults to False
+        csv_path (str): Path to CSV file. Defaults to FILE_PATH_CSV
+        is_synthetic (bool): If True uses synthetic data, if False uses original data. Defaults to False
+
+    Returns:
+        Any: ChromaDB collection instance
+
+    Notes:
+        - Independent of the agent modules: survives edits of prompts, tools and UI
+        - max_entries=1: a handle for other arguments replaces the old one
+    """
+    return load_system_collection(
+        is_azure_openai=is_azure_openai,
+        csv_path=csv_path,
+        vectorstore_type=VECTORSTORE_TYPE,
+        create_new_store=False,  # Gecachte Version lädt immer existierenden VectorStore
+        embedding_model="text-embedding-ada-002",
+        is_synthetic_data=is_synthetic
+    )
+
+
+@st.cache_resource(show_spinner=False, max_entries=1)
+def build_agents_cached(_collection, collection_key: tuple, agent_fingerprint: tuple):
+    """
+    Cached build_agent_system: agent graph per collection and agent source version.
+
+    Args:
+        _collection (Any): ChromaDB collection (not hashed, see collection_key)
+        collection_key (tuple): Arguments the collection was loaded with
+        agent_fingerprint (tuple): agent_modules_fingerprint() of the agent sources
+
+    Returns:
+        Any: Initialized Customer Manager Agent
+
+    Notes:
+        - max_entries=1: each edit of an agent/tool module changes the
+          fingerprint, so only the current graph (with its embedding function
+          and query cache) is kept alive instead of one per edit
+    """
+    return build_agent_system(_collection, embedding_model="text-embedding-ada-002")
+
+
 def initialize_system_cached(is_azure_openai: bool=False, csv_path: str=FILE_PATH_CSV, is_synthetic: bool=False):
     """
-    Streamlit wrapper for initialize_system with caching.
-    Calls business logic from helper_functions and adds UI-specific validation.
-    
+    Cached initialize_system: loads the VectorStore and builds agents once per process.
+
     Args:
         is_azure_openai (bool): If True uses Azure OpenAI, if False uses standard OpenAI. Defaults to False
         csv_path (str): Path to CSV file. Defaults to FILE_PATH_CSV
         is_synthetic (bool): If True uses synthetic data, if False uses original data. Defaults to False
-    
+
     Returns:
         tuple[Any, Any]: Tuple containing (customer_manager, collection) where:
             - customer_manager (Any): Initialized Customer Manager Agent
             - collection (Any): ChromaDB collection instance
-    
+
     Raises:
         ValueError: If initialization fails due to missing API keys or invalid configuration
         FileNotFoundError: If CSV file does not exist
+
+    Notes:
+        - Contains no Streamlit UI calls: cache_resource only stores
+          successful results, errors are rendered by initialize_system_ui
+        - Collection and agents are cached separately: changed agent/tool
+          modules only rebuild the agents on the existing Chroma handle
+    """
+    collection = load_collection_cached(
+        is_azure_openai=is_azure_openai,
+        csv_path=csv_path,
+        is_synthetic=is_synthetic
+    )
+    customer_manager = build_agents_cached(
+        collection,
+        (is_azure_openai, csv_path, is_synthetic),
+        agent_modules_fingerprint()
+    )
+    return customer_manager, collection
+
+
+def initialize_system_ui(is_azure_openai: bool=False, csv_path: str=FILE_PATH_CSV, is_synthetic: bool=False):
+    """
+    Streamlit wrapper around initialize_system_cached with UI error handling.
+
+    Args:
+        is_azure_openai (bool): If True uses Azure OpenAI, if False uses standard OpenAI. Defaults to False
+        csv_path (str): Path to CSV file. Defaults to FILE_PATH_CSV
+        is_synthetic (bool): If True uses synthetic data, if False uses original data. Defaults to False
+
+    Returns:
+        tuple[Any, Any]: Tuple containing (customer_manager, collection)
+
+    Notes:
+        - Shows the error and stops the script run on failure
     """
     try:
-        # Rufe die core Business-Logic auf (aus helper_functions)
-        customer_manager, collection = initialize_system(
+        return initialize_system_cached(
             is_azure_openai=is_azure_openai,
             csv_path=csv_path,
-            vectorstore_type=VECTORSTORE_TYPE,
-            create_new_store=False,  # Gecachte Version lädt immer existierenden VectorStore
-            embedding_model="text-embedding-ada-002",
-            is_synthetic_data=is_synthetic
+            is_synthetic=is_synthetic
         )
-        
-        return customer_manager, collection
-        
-    except ValueError as e:
+    except (ValueError, FileNotFoundError) as e:
         # Handle initialization errors with Streamlit UI
         st.error(str(e))
         st.stop()
-    except FileNotFoundError as e:
-        st.error(str(e))
-        st.stop()
     except Exception as e:
         st.error(f"❌ Unerwarteter Fehler bei System-Initialisierung: {e}")
         st.stop()
@@ -306,7 +691,7 @@ def main():
     if "conversation" not in st.session_state:
         st.session_state.conversation = SimpleConversationHistory()
     
-    # Ensure SQLiteSession is initialized (in-memory) for agents
+    # Ensure agent session is initialized (in-memory) for agents
     ensure_session_initialized()
 
     if "system_initialized" not in st.session_state:
@@ -315,7 +700,7 @@ def main():
     # System-Initialisierung nur beim ersten Mal durchführen
     if not st.session_state.system_initialized:
         # Prüfe VectorStore Status
-        vectorstore_exists, vectorstore_count = check_vectorstore_exists(
+        vectorstore_exists, vectorstore_count = check_vectorstore_exists_cached(
             vectorstore_path=VECTORSTORE_PATH,
             collection_name=VECTORSTORE_COLLECTION_NAME
         )
@@ -347,8 +732,12 @@ def main():
                     )
                     st.session_state.customer_manager = customer_manager
                     st.session_state.collection = collection
+                    # Dokumentanzahl einmalig abfragen (Collection ändert sich danach nicht)
+                    st.session_state.doc_count = collection.count()
                     st.session_state.system_initialized = True
-                    st.success(f"✅ VectorStore erfolgreich erstellt mit {collection.count():,} Dokumenten!")
+                    # Gecachter Existenz-Check ist nach dem Neuaufbau veraltet
+                    check_vectorstore_exists_cached.clear()
+                    st.success(f"✅ VectorStore erfolgreich erstellt mit {st.session_state.doc_count:,} Dokumenten!")
                     st.rerun()
                 except Exception as e:
                     st.error(f"❌ Fehler beim Erstellen des VectorStore: {e}")
@@ -357,47 +746,50 @@ def main():
             # VectorStore existiert bereits - nutze gecachte Version
             with st.spinner("🔄 Initialisiere RAG-System..."):
                 try:
-                    customer_manager, collection = initialize_system_cached(
+                    customer_manager, collection = initialize_system_ui(
                         is_azure_openai=IS_AZURE_OPENAI,
                         csv_path=FILE_PATH_CSV,
                         is_synthetic=USE_SYNTHETIC_DATA  # ✅ FLAG übergeben
                     )
                     st.session_state.customer_manager = customer_manager
                     st.session_state.collection = collection
+                    # Dokumentanzahl einmalig abfragen (Collection ändert sich danach nicht)
+                    st.session_state.doc_count = collection.count()
                     st.session_state.system_initialized = True
                     
                     data_source = "synthetischen" if USE_SYNTHETIC_DATA else "originalen"
-                    st.success(f"✅ System initialisiert mit {collection.count():,} Dokumenten aus {data_source} Daten")
+                    st.success(f"✅ System initialisiert mit {st.session_state.doc_count:,} Dokumenten aus {data_source} Daten")
                 except Exception as e:
                     st.error(f"❌ Fehler bei System-Initialisierung: {e}")
                     st.stop()
     
-    # SIDEBAR - Settings and Statistics
-    # ============================================================================
-
-    with st.sidebar:
-        render_sidebar_content(
-            example_queries=EXAMPLE_QUERIES,
-            get_stats_callback=get_cached_conversation_stats,
-            document_count=st.session_state.collection.count(),
-            history_limit=HISTORY_LIMIT
-        )
-        
-        # Run chart cleanup if enabled
-        if st.session_state.get('auto_delete_charts', False):
-            deleted, total = cleanup_charts_if_enabled(max_age_minutes=60)
-            if deleted > 0:
-                st.caption(f"🗑️ {deleted} alte Charts gelöscht")
-
 # ============================================================================
-# CHAT HISTORY DISPLAY - Shows all previous messages
+# CHAT HISTORY DISPLAY - Shows the latest previous messages
 # ============================================================================
     
     # Load and display history FIRST (before processing new queries)
-    history = st.session_state.conversation.get_history()
+    # Jeder Rerun rendert die Historie neu: nur die letzten Turns anzeigen,
+    # ältere erst auf Wunsch (Aufwand pro Rerun O(Fenster) statt O(Turns))
+    conversation = st.session_state.conversation
+    hidden_count = 0
+    if HISTORY_DISPLAY_WINDOW and not st.session_state.get("show_full_history", False):
+        hidden_count = max(0, conversation.get_conversation_count() - HISTORY_DISPLAY_WINDOW)
+
+    if hidden_count:
+        st.button(
+            f"⬆️ {hidden_count} ältere Nachrichten anzeigen",
+            key="show_full_history_btn",
+            on_click=show_full_history,
+        )
+        history = conversation.get_history(last_n=HISTORY_DISPLAY_WINDOW)
+    else:
+        history = conversation.get_history()
     
-    # Display all history messages
-    for _ , entry in enumerate(history):
+    # Chart-Größe einmal pro Durchlauf lesen statt pro Eintrag
+    chart_size = st.session_state.get('chart_size', 'Mittel')
+
+    # Display history messages
+    for entry in history:
         # User message
         with st.chat_message(name="user", avatar="🧑"):
             st.write(entry["user"])
@@ -408,28 +800,29 @@ def main():
             if response_text.startswith("❌ **ERROR:**"):
                 st.error(response_text)
             else:
-                # ✅ Check for charts in history (handle multiple charts)
-                text_content, chart_paths = extract_all_chart_paths(response_text)
+                # ✅ Bereinigter Text und Chart-Pfade wurden beim Speichern geparst
+                st.markdown(entry["text"])
                 
-                st.markdown(text_content)
-                
-                # ✅ Render ALL charts if found in history
-                if chart_paths:
-                    chart_size = st.session_state.get('chart_size', 'Mittel')
-                    for chart_path in chart_paths:
-                        render_chart(chart_path, size=chart_size)
+                # ✅ Render ALL charts stored with this entry
+                for chart_path in entry["chart_paths"]:
+                    render_chart(chart_path, size=chart_size)
 
 # ============================================================================
 # CHAT INPUT AT BOTTOM - Fixed position
 # ============================================================================
 
-    # ✅ Check for pending query from sidebar
+    # User input at the bottom of the page - immer rendern, sonst fehlt das
+    # Eingabefeld in Durchläufen, die eine Sidebar-Query verarbeiten
+    user_input = st.chat_input("Stelle Fragen zum customer feedback...")
+
+    # ✅ Pending query from sidebar overrides the chat input
     if "pending_query" in st.session_state:
-        user_input = st.session_state.pending_query
-        del st.session_state.pending_query
-    else:
-        # User input at the bottom of the page
-        user_input = st.chat_input("Stelle Fragen zum customer feedback...")
+        user_input = st.session_state.pop("pending_query")
+
+    # ✅ "Alle Beispiele ausführen": Queries parallel statt nacheinander
+    pending_queries = st.session_state.pop("pending_queries", None)
+    if pending_queries:
+        render_concurrent_queries(pending_queries, chart_size)
 
     # ✅ Process query with LIVE streaming, then rerun
     if user_input:
@@ -446,7 +839,8 @@ def main():
             response_placeholder.markdown("Nachdenken läuft...")
             
             # ✅ LIVE Token-Streaming from OpenAI (replaces "Thinking...")
-            streamed_text = response_placeholder.write_stream(
+            streamed_text = render_stream(
+                response_placeholder,
                 stream_agent_response(
                     st.session_state.customer_manager,
                     user_input,
@@ -455,51 +849,75 @@ def main():
                 )
             )
             
-            # After streaming, check for charts (handle multiple)
+            # Finales Ergebnis auswerten und Chart-Marker genau einmal parsen
             final_result = st.session_state.get('_streaming_final_result', None)
-            if final_result and final_result.get("type") != "error":
-                raw_response = final_result.get('final_output', streamed_text)
-                text_content, chart_paths = extract_all_chart_paths(raw_response)
-                if chart_paths:
-                    chart_size = st.session_state.get('chart_size', 'Mittel')
-                    for chart_path in chart_paths:
-                        render_chart(chart_path, size=chart_size)
-        
-        # After display, save to history and trigger rerun
-        # Process in background to save to history
-        final_result = st.session_state.get('_streaming_final_result', None)
-        
-        if final_result and final_result.get("type") == "error":
-            error_message = f"❌ **ERROR ({final_result.get('error_type', 'Unknown')}):** {final_result['error']}"
-            response_content = error_message
-            agent_name_str = "Assistant"
-        elif final_result:
-            raw_response = final_result.get('final_output', streamed_text)
-            agent_name_str = final_result.get('agent_name', 'Assistant')
-            response_content = raw_response
-        else:
-            response_content = streamed_text
-            agent_name_str = "Assistant"
+            chart_paths = []
+
+            if final_result and final_result.get("type") == "error":
+                error_message = f"❌ **ERROR ({final_result.get('error_type', 'Unknown')}):** {final_result['error']}"
+                response_content = error_message
+                text_content = error_message
+                agent_name_str = "Assistant"
+            else:
+                if final_result:
+                    response_content = final_result.get('final_output', streamed_text)
+                    agent_name_str = final_result.get('agent_name', 'Assistant')
+                else:
+                    response_content = streamed_text
+                    agent_name_str = "Assistant"
+                response_content = str(response_content) if response_content else ""
+                text_content, chart_paths = extract_all_chart_paths(response_content)
+
+            # After streaming, render charts (handle multiple)
+            for chart_path in chart_paths:
+                render_chart(chart_path, size=chart_size)
         
         # Cleanup
         if '_streaming_final_result' in st.session_state:
             del st.session_state._streaming_final_result
         
-        # Save to history - ensure response_content is string
+        # Save to history - bereinigter Text und Chart-Pfade werden mitgespeichert,
+        # damit der Replay-Loop bei Reruns nicht erneut parsen muss
+        # Kein st.rerun(): der neue Turn ist bereits angezeigt, ein erneuter
+        # Durchlauf würde nur die komplette Historie noch einmal rendern
         st.session_state.conversation.add_interaction(
             user_input=user_input,
-            agent_response=str(response_content) if response_content else "",
-            agent_name=agent_name_str)
+            agent_response=response_content,
+            agent_name=agent_name_str,
+            text=text_content,
+            chart_paths=chart_paths)
+
+# ============================================================================
+# SIDEBAR - Settings and Statistics
+# ============================================================================
+
+    # Nach der Query-Verarbeitung gerendert, damit die Statistiken den neuen
+    # Turn ohne zusätzlichen Rerun enthalten (Position im Layout unverändert)
+    # Statistiken einmal pro Durchlauf ermitteln (Sidebar und Footer teilen sie)
+    stats = get_cached_conversation_stats()
+
+    with st.sidebar:
+        render_sidebar_content(
+            example_queries=EXAMPLE_QUERIES,
+            stats=stats,
+            document_count=st.session_state.doc_count,
+            history_limit=HISTORY_LIMIT
+        )
         
-        # Trigger rerun to show clean history
-        st.rerun()
+        # Run chart cleanup if enabled
+        if st.session_state.get('auto_delete_charts', False):
+            deleted, total = cleanup_charts_if_enabled(max_age_minutes=60)
+            if deleted > 0:
+                # Gecachte Existenz-Prüfungen/Inhalte sind für gelöschte Charts veraltet
+                resolve_chart_path.cache_clear()
+                load_chart_bytes.cache_clear()
+                st.caption(f"🗑️ {deleted} alte Charts gelöscht")
 
 # ============================================================================
 # FOOTER - Modular Footer with Live Statistics
 # ============================================================================
 
-    # Use modular footer component with cached stats
-    stats = get_cached_conversation_stats()
+    # Use modular footer component with the stats of this run
     render_footer(stats)
 
 
@@ -4,10 +4,14 @@
 Components for the main UI header of the Streamlit app.
 """
 
+import math
+
 import streamlit as st
-import time
 from .theme_config import COLORS, TYPOGRAPHY
 
+# Blink-Intervall des Cursors (Sekunden)
+_CARET_BLINK = 0.75
+
 
 def render_main_title() -> None:
     """
@@ -65,8 +69,9 @@ def render_subtitle_with_typewriter(
     Notes:
         - Typewriter effect runs only once per session
         - Uses session_state to track completion status
-        - Shows blinking cursor ("|") during typing
-        - Removes cursor after completion
+        - Animated client-side via CSS (steps() per character): one render,
+          no time.sleep blocking the script run
+        - Shows blinking cursor during typing, hidden after completion
         - Subsequent renders show final text immediately
         - Uses COLORS["text_secondary"] for subtitle color
     """
@@ -81,25 +86,37 @@ def render_subtitle_with_typewriter(
     """
 
     if not st.session_state[session_key]:
-        # Typewriter-Effekt
-        placeholder = st.empty()
-
-        for i in range(len(text) + 1):
-            typing_text = f"""
-            <h3 style="{subtitle_style}">
-                {text[:i]}|
-            </h3>
-            """
-            placeholder.markdown(typing_text, unsafe_allow_html=True)
-            time.sleep(speed)
-
-        # Entferne Cursor am Ende
-        final_text = f"""
+        # Typewriter-Effekt im Browser (CSS) statt Zeichen-für-Zeichen-Renders
+        steps = max(len(text), 1)
+        duration = steps * speed
+        caret_cycles = math.ceil(duration / _CARET_BLINK)
+        typing_text = f"""
+        <style>
+            @keyframes cfa-reveal {{ from {{ clip-path: inset(0 100% 0 0); }} to {{ clip-path: inset(0 0 0 0); }} }}
+            @keyframes cfa-caret-move {{ from {{ left: 0; }} to {{ left: 100%; }} }}
+            @keyframes cfa-caret-blink {{
+                from, to {{ border-color: transparent; }}
+                50% {{ border-color: currentColor; }}
+            }}
+            .cfa-typewriter {{ position: relative; display: inline-block; }}
+            .cfa-typewriter-text {{
+                display: inline-block;
+                animation: cfa-reveal {duration:.2f}s steps({steps}, end) both;
+            }}
+            .cfa-typewriter-caret {{
+                position: absolute;
+                top: 10%;
+                bottom: 10%;
+                border-left: 2px solid transparent;
+                animation: cfa-caret-move {duration:.2f}s steps({steps}, end) both,
+                           cfa-caret-blink {_CARET_BLINK}s step-end {caret_cycles};
+            }}
+        </style>
         <h3 style="{subtitle_style}">
-            {text}
+            <span class="cfa-typewriter"><span class="cfa-typewriter-text">{text}</span><span class="cfa-typewriter-caret"></span></span>
         </h3>
         """
-        placeholder.markdown(final_text, unsafe_allow_html=True)
+        st.markdown(typing_text, unsafe_allow_html=True)
 
         # Markiere als abgeschlossen
         st.session_state[session_key] = True
@@ -4,33 +4,31 @@
 Main layout styles for containers, padding, margins, and general spacing rules.
 """
 
+import re
+
 import streamlit as st
 
 
-def apply_main_layout_styles() -> None:
+def _minify_css(css: str) -> str:
     """
-    Applies main layout styles to the Streamlit app.
+    Strips comments and redundant whitespace from a CSS block.
+
+    Args:
+        css (str): CSS source (may include the surrounding <style> tags)
 
     Returns:
-        None
+        str: Minified CSS with identical rules
+    """
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.DOTALL)
+    css = re.sub(r"\s+", " ", css)
+    css = re.sub(r"\s*([{};,])\s*", r"\1", css)
+    return css.replace(";}", "}").strip()
 
-    Features:
-        - Reduced top padding for more viewport space
-        - Optimized spacing for header areas
-        - Footer-friendly bottom padding
-        - Consistent margin rules
-        - Responsive side padding
-        
-    Notes:
-        - Sets transparent app header background
-        - Adjusts block-container padding (top: 1rem, bottom: 0, sides: 5rem)
-        - Removes default margins from h1 and h3 elements
-        - Reduces hr (divider) spacing to 1rem
-        - Should be called early in app initialization
+
+# Einmal beim Import aufbereitet - jeder Rerun sendet nur diese kompakte Form
+_MAIN_LAYOUT_CSS = _minify_css(
     """
-    st.markdown(
-        """
-    <style>
+<style>
             /* Remove top margin */
             .stAppHeader {
                 background-color: rgba(255, 255, 255, 0.0);  /* Transparent bg */
@@ -59,6 +57,34 @@ def apply_main_layout_styles() -> None:
                 margin: 1rem 0 !important;
             }
     </style>
-    """,
-        unsafe_allow_html=True,
-    )
\ No newline at end of file
+"""
+)
+
+
+def apply_main_layout_styles() -> None:
+    """
+    Applies main layout styles to the Streamlit app.
+
+    Returns:
+        None
+
+    Features:
+        - Reduced top padding for more viewport space
+        - Optimized spacing for header areas
+        - Footer-friendly bottom padding
+        - Consistent margin rules
+        - Responsive side padding
+        
+    Notes:
+        - Sets transparent app header background
+        - Adjusts block-container padding (top: 1rem, bottom: 0, sides: 5rem)
+        - Removes default margins from h1 and h3 elements
+        - Reduces hr (divider) spacing to 1rem
+        - Should be called early in app initialization
+        - Must run on every rerun: Streamlit drops elements that are not
+          re-rendered, so a one-shot guard would lose the styles. The CSS is
+          minified once at import to keep the per-rerun payload small
+    """
+    # CSS muss bei jedem Rerun emittiert werden (Streamlit entfernt nicht erneut
+    # gerenderte Elemente) - daher nur die vorab minifizierte Konstante senden
+    st.markdown(_MAIN_LAYOUT_CSS, unsafe_allow_html=True)
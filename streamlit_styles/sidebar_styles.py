@@ -6,31 +6,39 @@ export options, system info, and agent information.
 """
 
 import streamlit as st
-from typing import List, Dict, Any, Optional
+from typing import Dict, Any, Optional, Sequence
 
 
-def render_example_queries(example_queries: List[str]) -> None:
+def render_example_queries(example_queries: Sequence[str]) -> None:
     """
     Renders example query buttons in the sidebar.
     
     Args:
-        example_queries (List[str]): List of example query strings to display as buttons
+        example_queries (Sequence[str]): Example query strings to display as buttons
         
     Returns:
         None
         
     Features:
         - Full-width buttons for each query
+        - Index-based widget keys (sidebar_ex_<i>), stable across reruns
         - Sets pending_query in session state when clicked
+        - "Alle Beispiele ausführen" queues every example (pending_queries)
         - Triggers rerun for immediate query execution
     """
     st.subheader("💡 Beispiel-Fragen")
     
-    for query in example_queries:
-        if st.button(query, key=f"sidebar_{query}", use_container_width=True):
+    # Kurze, stabile Widget-Keys über den Index statt des vollen Fragetexts
+    for i, query in enumerate(example_queries):
+        if st.button(query, key=f"sidebar_ex_{i}", use_container_width=True):
             st.session_state.pending_query = query
             st.rerun()
 
+    # Demo-Flow: alle Beispiele (parallel ausgeführt) in den Chat übernehmen
+    if st.button("▶️ Alle Beispiele ausführen", key="sidebar_ex_all", use_container_width=True):
+        st.session_state.pending_queries = list(example_queries)
+        st.rerun()
+
 
 def render_chart_size_selector() -> None:
     """
@@ -68,13 +76,11 @@ def render_chart_size_selector() -> None:
     )
 
 
-def render_export_options(get_stats_callback) -> None:
+@st.fragment
+def render_export_options() -> None:
     """
     Renders export and history management options in the sidebar.
     
-    Args:
-        get_stats_callback (callable): Function to retrieve conversation statistics
-        
     Returns:
         None
         
@@ -83,17 +89,21 @@ def render_export_options(get_stats_callback) -> None:
         - Download button for text export
         - Clear history button with immediate rerun
         - Warning if no conversation exists
+
+    Notes:
+        - Runs as st.fragment: the export button only reruns this section
+          instead of the whole app (no chat history replay)
+        - Clearing the history still triggers a full app rerun
     """
     st.subheader("📄 Export-Optionen")
     
     if st.button("📋 Als Text exportieren", use_container_width=True):
         if st.session_state.conversation.get_conversation_count() > 0:
-            export_stats = get_stats_callback()
             export_text = st.session_state.conversation.export_history("text")
             st.download_button(
                 "💾 Text herunterladen",
                 export_text,
-                file_name=f"conversation_{export_stats['session_id']}.txt",
+                file_name=f"conversation_{st.session_state.conversation.session_id}.txt",
                 mime="text/plain",
                 use_container_width=True,
             )
@@ -102,7 +112,7 @@ def render_export_options(get_stats_callback) -> None:
     
     if st.button("🧹 Historie löschen", use_container_width=True):
         st.session_state.conversation.clear_history()
-        st.rerun()
+        st.rerun(scope="app")
 
 
 def render_system_info(document_count: int) -> None:
@@ -228,8 +238,8 @@ def render_conversation_summary(stats: Dict[str, Any]) -> None:
 
 
 def render_sidebar_content(
-    example_queries: List[str],
-    get_stats_callback,
+    example_queries: Sequence[str],
+    stats: dict,
     document_count: int,
     history_limit: Optional[int] = None
 ) -> None:
@@ -237,8 +247,8 @@ def render_sidebar_content(
     Main function to render complete sidebar content.
     
     Args:
-        example_queries (List[str]): List of example query strings
-        get_stats_callback (callable): Function to retrieve conversation statistics
+        example_queries (Sequence[str]): Example query strings
+        stats (dict): Conversation statistics of the current run
         document_count (int): Number of documents in vector store
         history_limit (int, optional): History limit for conversation. Defaults to None.
         
@@ -248,7 +258,7 @@ def render_sidebar_content(
     Features:
         - Renders all sidebar components in proper order
         - Adds dividers between sections for visual separation
-        - Handles conversation stats dynamically
+        - Uses the stats computed once per run in main() (shared with the footer)
         
     Component Order:
         1. Example Queries
@@ -268,7 +278,7 @@ def render_sidebar_content(
     st.divider()
     
     # Export Options
-    render_export_options(get_stats_callback)
+    render_export_options()
     st.divider()
     
     # System Info (Documents only)
@@ -281,5 +291,4 @@ def render_sidebar_content(
     render_history_limit_caption(history_limit)
     
     # Conversation Statistics (always visible)
-    stats = get_stats_callback()
     render_conversation_summary(stats)
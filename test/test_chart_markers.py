@@ -0,0 +1,48 @@
+"""Tests for chart marker handling in the conversation history."""
+
+from utils.chart_markers import CHART_MARKER_RE
+from utils.in_memory_session import _strip_chart_markers
+
+
+def test_marker_pattern_matches_paths_with_underscores():
+    text = "Hier: __CHART__charts/sentiment_20240101_120000_12.png__CHART__"
+
+    assert CHART_MARKER_RE.findall(text) == ["charts/sentiment_20240101_120000_12.png"]
+
+
+def test_marker_pattern_matches_multiple_markers_separately():
+    text = "__CHART__charts/a_1.png__CHART__ und __CHART__charts/b_2.png__CHART__"
+
+    assert CHART_MARKER_RE.findall(text) == ["charts/a_1.png", "charts/b_2.png"]
+
+
+def test_strip_chart_markers_removes_marker_from_string_content():
+    item = {
+        "role": "assistant",
+        "content": "Hier: __CHART__charts/sentiment_20240101_120000_12.png__CHART__",
+    }
+
+    assert _strip_chart_markers(item) == {"role": "assistant", "content": "Hier:"}
+    # Original-Item bleibt unverändert
+    assert "__CHART__" in item["content"]
+
+
+def test_strip_chart_markers_cleans_text_parts():
+    item = {
+        "role": "assistant",
+        "content": [
+            {"type": "output_text", "text": "Chart __CHART__charts/nps_bar_1.png__CHART__"},
+            {"type": "output_text", "text": "Ohne Marker"},
+        ],
+    }
+
+    cleaned = _strip_chart_markers(item)
+
+    assert [part["text"] for part in cleaned["content"]] == ["Chart", "Ohne Marker"]
+
+
+def test_strip_chart_markers_returns_unmarked_items_unchanged():
+    item = {"role": "user", "content": "Wie ist das Sentiment in DE?"}
+
+    assert _strip_chart_markers(item) is item
+    assert _strip_chart_markers("kein dict") == "kein dict"
@@ -0,0 +1,101 @@
+"""Tests for the in-memory agent session and its turn bookkeeping."""
+
+import asyncio
+
+from utils.in_memory_session import InMemorySession
+
+
+def user(text):
+    return {"role": "user", "content": text}
+
+
+def assistant(text):
+    return {"role": "assistant", "content": text}
+
+
+def tool_call(name):
+    return {"type": "function_call", "name": name}
+
+
+def make_session(max_turns=None):
+    """Session with three turns; the second one contains a tool call."""
+    session = InMemorySession("test", max_turns=max_turns)
+    asyncio.run(session.add_items([user("u1"), assistant("a1")]))
+    asyncio.run(session.add_items([user("u2"), tool_call("search"), assistant("a2")]))
+    asyncio.run(session.add_items([user("u3"), assistant("a3")]))
+    return session
+
+
+def test_get_items_returns_all_items_without_max_turns():
+    session = make_session()
+
+    assert len(asyncio.run(session.get_items())) == 7
+
+
+def test_max_turns_starts_at_nth_latest_user_item():
+    session = make_session(max_turns=2)
+
+    items = asyncio.run(session.get_items())
+
+    # Beginnt beim vorletzten User-Turn, Tool-Call bleibt beim Turn
+    assert items == [user("u2"), tool_call("search"), assistant("a2"), user("u3"), assistant("a3")]
+
+
+def test_max_turns_larger_than_history_returns_everything():
+    session = make_session(max_turns=10)
+
+    assert len(asyncio.run(session.get_items())) == 7
+
+
+def test_limit_within_max_turns_window():
+    session = make_session(max_turns=2)
+
+    assert asyncio.run(session.get_items(limit=3)) == [assistant("a2"), user("u3"), assistant("a3")]
+
+
+def test_limit_does_not_reach_beyond_max_turns_window():
+    session = make_session(max_turns=1)
+
+    assert asyncio.run(session.get_items(limit=5)) == [user("u3"), assistant("a3")]
+    assert asyncio.run(session.get_items(limit=0)) == []
+
+
+def test_max_turns_change_applies_to_existing_history():
+    session = make_session()
+
+    session.max_turns = 1
+
+    assert asyncio.run(session.get_items()) == [user("u3"), assistant("a3")]
+
+
+def test_pop_item_keeps_turn_starts_in_sync():
+    session = make_session(max_turns=1)
+
+    assert asyncio.run(session.pop_item()) == assistant("a3")
+    assert asyncio.run(session.pop_item()) == user("u3")
+    assert session._turn_starts == [0, 2]
+
+    # Letzter verbleibender Turn ist jetzt u2
+    assert asyncio.run(session.get_items()) == [user("u2"), tool_call("search"), assistant("a2")]
+
+    asyncio.run(session.add_items([user("u4")]))
+    assert session._turn_starts == [0, 2, 5]
+    assert asyncio.run(session.get_items()) == [user("u4")]
+
+
+def test_pop_item_on_empty_session_returns_none():
+    session = InMemorySession("empty")
+
+    assert asyncio.run(session.pop_item()) is None
+
+
+def test_clear_session_resets_items_and_turns():
+    session = make_session(max_turns=2)
+
+    asyncio.run(session.clear_session())
+
+    assert asyncio.run(session.get_items()) == []
+    assert session._turn_starts == []
+
+    asyncio.run(session.add_items([user("neu"), assistant("antwort")]))
+    assert asyncio.run(session.get_items()) == [user("neu"), assistant("antwort")]
@@ -0,0 +1,77 @@
+"""Tests for coalescing concurrent feedback searches (SearchBatcher)."""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+pytest.importorskip("agents")
+
+from customer_agents_tools.search_tool import SearchBatcher  # noqa: E402
+
+
+class FakeCollection:
+    """Records query calls and answers one row per query text."""
+
+    def __init__(self):
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def query(self, query_texts=None, query_embeddings=None, n_results=5, where=None, include=None):
+        texts = query_texts if query_texts is not None else [str(e) for e in query_embeddings]
+        with self._lock:
+            self.calls.append({"texts": list(texts), "where": where})
+        return {
+            "ids": [[f"id-{text}"] for text in texts],
+            "documents": [[f"doc-{text}"] for text in texts],
+            "distances": [[0.1] for _ in texts],
+        }
+
+
+def run_concurrently(batcher, requests):
+    with ThreadPoolExecutor(max_workers=len(requests)) as pool:
+        futures = [
+            pool.submit(batcher.query, text, 5, where, ["documents", "distances"])
+            for text, where in requests
+        ]
+        return [future.result() for future in futures]
+
+
+def test_concurrent_queries_with_same_filter_share_one_call():
+    collection = FakeCollection()
+    batcher = SearchBatcher(collection, window_seconds=0.2)
+
+    results = run_concurrently(batcher, [("a", None), ("b", None), ("c", None)])
+
+    assert len(collection.calls) == 1
+    assert sorted(collection.calls[0]["texts"]) == ["a", "b", "c"]
+    # Jede Suche bekommt ihre eigene Zeile im Single-Query-Format zurück
+    assert [r["documents"] for r in results] == [[["doc-a"]], [["doc-b"]], [["doc-c"]]]
+
+
+def test_queries_with_different_filters_are_batched_separately():
+    collection = FakeCollection()
+    batcher = SearchBatcher(collection, window_seconds=0.2)
+    de = {"country": "DE"}
+    at = {"country": "AT"}
+
+    results = run_concurrently(batcher, [("a", de), ("b", at), ("c", de)])
+
+    assert len(collection.calls) == 2
+    texts_by_country = {call["where"]["country"]: sorted(call["texts"]) for call in collection.calls}
+    assert texts_by_country == {"DE": ["a", "c"], "AT": ["b"]}
+    assert [r["ids"] for r in results] == [[["id-a"]], [["id-b"]], [["id-c"]]]
+
+
+def test_batch_error_is_raised_for_every_query():
+    class FailingCollection:
+        def query(self, **kwargs):
+            raise RuntimeError("chroma down")
+
+    batcher = SearchBatcher(FailingCollection(), window_seconds=0.2)
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        futures = [pool.submit(batcher.query, t, 5, None, ["documents"]) for t in ("a", "b")]
+        for future in futures:
+            with pytest.raises(RuntimeError, match="chroma down"):
+                future.result()
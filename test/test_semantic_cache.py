@@ -0,0 +1,83 @@
+"""Tests for the in-process semantic query cache."""
+
+import numpy as np
+import pytest
+
+from utils import semantic_cache
+from utils.semantic_cache import SemanticQueryCache
+
+KEY = (5, "null", ("documents",))
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable replacement for time.monotonic inside the cache module."""
+    now = [1000.0]
+    monkeypatch.setattr(semantic_cache.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_exact_hit_ignores_case_and_whitespace(clock):
+    cache = SemanticQueryCache()
+    cache.add(KEY, "Beschwerden  in DE", np.array([1.0, 0.0]), "result")
+
+    assert cache.get_exact(KEY, "beschwerden in de") == "result"
+    assert cache.hits == 1
+
+
+def test_exact_miss_for_other_text_or_key(clock):
+    cache = SemanticQueryCache()
+    cache.add(KEY, "Beschwerden in DE", np.array([1.0, 0.0]), "result")
+
+    assert cache.get_exact(KEY, "Beschwerden in AT") is None
+    assert cache.get_exact((10, "null", ("documents",)), "Beschwerden in DE") is None
+
+
+def test_similar_hit_above_threshold(clock):
+    cache = SemanticQueryCache(similarity_threshold=0.99)
+    cache.add(KEY, "a", np.array([1.0, 0.0]), "result")
+
+    assert cache.get_similar(KEY, np.array([1.0, 0.01])) == "result"
+    assert cache.hits == 1
+
+
+def test_similar_miss_below_threshold(clock):
+    cache = SemanticQueryCache(similarity_threshold=0.99)
+    cache.add(KEY, "a", np.array([1.0, 0.0]), "result")
+
+    # cos ≈ 0.97 → zu unähnlich für den Default-Threshold
+    assert cache.get_similar(KEY, np.array([1.0, 0.25])) is None
+    assert cache.misses == 1
+
+
+def test_expired_entries_are_evicted(clock):
+    cache = SemanticQueryCache(ttl_seconds=60)
+    cache.add(KEY, "a", np.array([1.0, 0.0]), "old")
+
+    clock[0] += 61
+
+    assert cache.get_exact(KEY, "a") is None
+    assert cache.get_similar(KEY, np.array([1.0, 0.0])) is None
+    assert cache._partitions[KEY].texts == []
+
+
+def test_similar_ignores_expired_better_match(clock):
+    cache = SemanticQueryCache(similarity_threshold=0.99, ttl_seconds=60)
+    cache.add(KEY, "alt", np.array([1.0, 0.0]), "old")
+    clock[0] += 30
+    cache.add(KEY, "neu", np.array([1.0, 0.1]), "new")
+    clock[0] += 31
+
+    # Der exakt passende Eintrag ist abgelaufen, der frische liegt über dem Threshold
+    assert cache.get_similar(KEY, np.array([1.0, 0.0])) == "new"
+
+
+def test_oldest_entry_is_evicted_when_full(clock):
+    cache = SemanticQueryCache(max_entries=2)
+    cache.add(KEY, "a", np.array([1.0, 0.0]), "ra")
+    cache.add(KEY, "b", np.array([0.0, 1.0]), "rb")
+    cache.add(KEY, "c", np.array([-1.0, 0.0]), "rc")
+
+    assert cache.get_exact(KEY, "a") is None
+    assert cache.get_exact(KEY, "b") == "rb"
+    assert cache.get_exact(KEY, "c") == "rc"
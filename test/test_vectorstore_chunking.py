@@ -0,0 +1,63 @@
+"""Tests for chunking rows of the Chroma VectorStore."""
+
+import pandas as pd
+import pytest
+
+pytest.importorskip("chromadb")
+pytest.importorskip("openai")
+
+from db.vectorstore_chroma import ChromaVectorStore  # noqa: E402
+
+
+def make_store(verbatims):
+    """Store instance for chunking only (no Chroma client, no persist directory)."""
+    store = ChromaVectorStore.__new__(ChromaVectorStore)
+    store.data = pd.DataFrame(
+        {
+            "Verbatim": verbatims,
+            "NPS": [9] * len(verbatims),
+            "Market": ["C1-DE"] * len(verbatims),
+            "Date": ["2024-01-01"] * len(verbatims),
+        }
+    )
+    store.validate_metadata = False
+    store.store_preview = False
+    store._row_offset = 0
+    return store
+
+
+def iter_chunks(store):
+    contents, lengths = store._prepare_contents()
+    errors = []
+    chunks = list(store._iter_chunks(contents, lengths, errors))
+    return chunks, errors
+
+
+def test_short_feedback_is_a_single_chunk():
+    store = make_store(["Lieferung kam pünktlich, alles bestens."])
+
+    chunks, errors = iter_chunks(store)
+
+    assert errors == []
+    assert [chunk_id for _, _, chunk_id in chunks] == [ChromaVectorStore._make_chunk_id(0, 0)]
+    assert chunks[0][1]["total_chunks"] == 1
+
+
+def test_row_with_too_many_chunks_is_skipped_completely():
+    # ~200k Zeichen → deutlich mehr als 64 Chunks à 3000 Zeichen (600 Overlap)
+    too_long = "Sehr langes Feedback mit vielen Wörtern. " * 5000
+    store = make_store(["Kurzes Feedback vorher.", too_long, "Kurzes Feedback danach."])
+
+    chunks, errors = iter_chunks(store)
+
+    row_ids = {int(chunk_id, 16) >> 6 for _, _, chunk_id in chunks}
+    assert row_ids == {0, 2}
+    assert all(metadata["row_id"] != 1 for _, metadata, _ in chunks)
+    assert len(errors) == 1
+    assert errors[0][0] == 1
+    assert "Zu viele Chunks" in errors[0][1]
+
+
+def test_make_chunk_id_rejects_chunk_index_beyond_id_bits():
+    with pytest.raises(ValueError):
+        ChromaVectorStore._make_chunk_id(0, ChromaVectorStore._MAX_CHUNKS_PER_ROW)
@@ -0,0 +1,12 @@
+"""
+Chart Markers - Shared pattern for __CHART__[path]__CHART__ markers.
+
+Agents embed generated chart paths as markers in their responses; the UI
+renders them as images and strips them from text and agent context.
+"""
+
+import re
+
+# Chart-Pfade enthalten Unterstriche (z.B. sentiment_20240101_120000_12.png),
+# daher non-greedy statt [^_]+; Gruppe 1 = Chart-Pfad
+CHART_MARKER_RE = re.compile(r'__CHART__(.*?)__CHART__')
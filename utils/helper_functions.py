@@ -1,6 +1,8 @@
 import os
-import re
+import asyncio
 import chromadb
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 from agents import (
     set_default_openai_client,
     set_default_openai_api,
@@ -13,15 +15,19 @@ from openai import AsyncAzureOpenAI, AsyncOpenAI, OpenAIError
 from typing import Any, AsyncGenerator
 import pandas as pd
 
-# Import base utilities (avoid circular imports by importing agents only in initialize_system)
+# Import base utilities (avoid circular imports by importing agents only in build_agent_system)
 from utils.csv_loader import CSVloader
 from utils.prepare_customer_data import PrepareCustomerData
 from db.vectorstore_chroma import ChromaVectorStore
+from utils.semantic_cache import SemanticQueryCache
+from utils.in_memory_session import InMemorySession
+from utils.chart_markers import CHART_MARKER_RE
 from test.test_questions import TestQuestions
 from utils.synthetic_data_generator import AdvancedSyntheticFeedbackGenerator
 from datetime import datetime
 
 
+@lru_cache(maxsize=None)
 def is_azure_openai() -> bool:
     """
     Checks if Azure OpenAI is configured based on environment variables.
@@ -35,6 +41,8 @@ def is_azure_openai() -> bool:
     Notes:
         - Used to determine which OpenAI client to instantiate
         - Falls back to standard OpenAI if any variable is missing
+        - Memoized: environment is read on the first call only (load .env
+          before), is_azure_openai.cache_clear() forces a re-check
     """
     return bool(
         os.environ.get("AZURE_OPENAI_API_KEY") and 
@@ -231,7 +239,7 @@ def write_prepared_csv(
 
 
 def load_vectorstore(
-    data: pd.DataFrame, 
+    data: pd.DataFrame | None, 
     type: str = "chroma", 
     create_new_store: bool = False,
     embedding_model: str = "text-embedding-ada-002"
@@ -240,7 +248,8 @@ def load_vectorstore(
     Loads or creates a VectorStore.
     
     Args:
-        data (pd.DataFrame): DataFrame containing customer feedback data
+        data (pd.DataFrame | None): DataFrame containing customer feedback data.
+                                  None only opens an existing store (no source data needed)
         type (str): VectorStore type (currently only "chroma" is supported). Defaults to "chroma"
         create_new_store (bool): If True, creates new VectorStore; if False, loads existing one. Defaults to False
         embedding_model (str): OpenAI embedding model. Defaults to "text-embedding-ada-002"
@@ -250,28 +259,47 @@ def load_vectorstore(
     
     Returns:
         Any | None: ChromaDB Collection object if successful, None on error
+                    (or, with data=None, if no store exists yet)
+
+    Notes:
+        - The loaded collection is warmed up (index in page cache and memory),
+          so the first user query does not pay the cold-start latency
     """
     if type == "chroma":
-        vectorstore_manager = ChromaVectorStore(
-            data=data,
-            file_path="./chroma",
-            file_name="feedback_vectorstore",
-            collection_name="feedback_data",
-            batch_size=100,
-            embedding_model=embedding_model,  # ✅ Übergebenes Modell verwenden
-        )
+        if data is None and not create_new_store:
+            # Existierender Store: Quelldaten werden nicht gebraucht
+            chroma_collection = ChromaVectorStore.open_existing(
+                file_path="./chroma",
+                file_name="feedback_vectorstore",
+                collection_name="feedback_data",
+                embedding_model=embedding_model,
+            )
+        else:
+            vectorstore_manager = ChromaVectorStore(
+                data=data,
+                file_path="./chroma",
+                file_name="feedback_vectorstore",
+                collection_name="feedback_data",
+                batch_size=5000,
+                embedding_model=embedding_model,  # ✅ Übergebenes Modell verwenden
+            )
 
-        chroma_collection = vectorstore_manager.create_vectorstore(
-            force_recreate=create_new_store
-        )
+            chroma_collection = vectorstore_manager.create_vectorstore(
+                force_recreate=create_new_store
+            )
         
-        # Info-Ausgabe (inline statt separater Funktion)
+        # Dokumentanzahl wurde beim Laden/Erstellen bereits ausgegeben
         if chroma_collection:
-            print(f"VectorStore loaded with {chroma_collection.count()} documents")
+            # Kaltstart (Page-Faults, HNSW-Laden) hier statt bei der ersten Query
+            ChromaVectorStore.warm_up(
+                chroma_collection, os.path.join("./chroma", "feedback_vectorstore")
+            )
 
         # Check if collection was successfully created/loaded
         if chroma_collection is None:
-            print("❌ ERROR: VectorStore could not be created/loaded!")
+            # Ohne Daten ist ein fehlender Store kein Fehler (Aufrufer baut ihn auf)
+            if data is not None:
+                print("❌ ERROR: VectorStore could not be created/loaded!")
             return None
         
         return chroma_collection
@@ -355,6 +383,44 @@ def get_openai_client() -> AsyncOpenAI | None:
     return None
 
 
+# Reihenfolge der Testfragen-Kategorien (entspricht den Flags von get_test_questions)
+_TEST_QUESTION_CATEGORIES = (
+    "META_QUESTIONS",
+    "FEEDBACK_ANALYSIS_QUESTIONS",
+    "MARKET_VALIDATION_QUESTIONS",
+    "SENTIMENT_QUESTIONS",
+    "USER_PARAMETER_QUESTIONS",
+    "COMPLEX_QUESTIONS",
+    "EDGE_CASES",
+)
+
+
+@lru_cache(maxsize=64)
+def _collect_test_questions(
+    enabled: tuple[bool, ...], questions_per_category: int
+) -> tuple[str, ...]:
+    """
+    Collects test questions for the enabled categories (memoized).
+
+    Args:
+        enabled (tuple[bool, ...]): One flag per entry in _TEST_QUESTION_CATEGORIES
+        questions_per_category (int): Max. questions per category (<= 0 = all)
+
+    Returns:
+        tuple[str, ...]: Immutable question tuple, safe to share between calls
+    """
+    test_queries = []
+    for category, is_enabled in zip(_TEST_QUESTION_CATEGORIES, enabled):
+        if not is_enabled:
+            continue
+        questions = TestQuestions.get_questions_by_category(category)
+        if questions_per_category > 0 and questions_per_category <= len(questions):
+            test_queries.extend(questions[:questions_per_category])
+        else:
+            test_queries.extend(questions)
+    return tuple(test_queries)
+
+
 def get_test_questions(
     test_meta: bool = True,
     test_feedback: bool = True,
@@ -380,69 +446,28 @@ def get_test_questions(
 
     Returns:
         list[str]: List of generated test questions
-    """
-    test_queries = []
-
-    if test_meta:
-        questions = TestQuestions.get_questions_by_category("META_QUESTIONS")
-        if questions_per_category > 0 and questions_per_category <= len(questions):
-            test_queries.extend(questions[:questions_per_category])
-        else:
-            test_queries.extend(questions)
-
-    if test_feedback:
-        questions = TestQuestions.get_questions_by_category(
-            "FEEDBACK_ANALYSIS_QUESTIONS"
-        )
-        if questions_per_category > 0 and questions_per_category <= len(questions):
-            test_queries.extend(questions[:questions_per_category])
-        else:
-            test_queries.extend(questions)
-
-    if test_validation:
-        questions = TestQuestions.get_questions_by_category(
-            "MARKET_VALIDATION_QUESTIONS"
-        )
-        if questions_per_category > 0 and questions_per_category <= len(questions):
-            test_queries.extend(questions[:questions_per_category])
-        else:
-            test_queries.extend(questions)
-
-    if test_sentiment:
-        questions = TestQuestions.get_questions_by_category("SENTIMENT_QUESTIONS")
-        if questions_per_category > 0 and questions_per_category <= len(questions):
-            test_queries.extend(questions[:questions_per_category])
-        else:
-            test_queries.extend(questions)
-
-    if test_parameters:
-        questions = TestQuestions.get_questions_by_category("USER_PARAMETER_QUESTIONS")
-        if questions_per_category > 0 and questions_per_category <= len(questions):
-            test_queries.extend(questions[:questions_per_category])
-        else:
-            test_queries.extend(questions)
 
-    if test_complex:
-        questions = TestQuestions.get_questions_by_category("COMPLEX_QUESTIONS")
-        if questions_per_category > 0 and questions_per_category <= len(questions):
-            test_queries.extend(questions[:questions_per_category])
-        else:
-            test_queries.extend(questions)
-
-    if test_edge:
-        questions = TestQuestions.get_questions_by_category("EDGE_CASES")
-        if questions_per_category > 0 and questions_per_category <= len(questions):
-            test_queries.extend(questions[:questions_per_category])
-        else:
-            test_queries.extend(questions)
-
-    return test_queries
+    Notes:
+        - Results are memoized per flag combination (_collect_test_questions)
+    """
+    enabled = (
+        test_meta,
+        test_feedback,
+        test_validation,
+        test_sentiment,
+        test_parameters,
+        test_complex,
+        test_edge,
+    )
+    # Neue Liste pro Aufruf, damit Aufrufer das gecachte Ergebnis nicht verändern
+    return list(_collect_test_questions(enabled, questions_per_category))
 
 
 # ============================================================================
 # VERSCHOBEN AUS streamlit_app.py - BUSINESS LOGIC & UTILITIES
 # ============================================================================
 
+
 def extract_chart_path(text: str) -> tuple[str, str | None]:
     """
     Extrahiert Chart-Pfad aus Response-Text (Format: __CHART__[pfad]__CHART__).
@@ -464,12 +489,11 @@ def extract_chart_path(text: str) -> tuple[str, str | None]:
         >>> print(clean_text)  # "Analysis complete"
         >>> print(path)  # "./charts/plot.png"
     """
-    pattern = r'__CHART__(.*?)__CHART__'
-    match = re.search(pattern, text)
+    match = CHART_MARKER_RE.search(text)
     
     if match:
         chart_path = match.group(1).strip()
-        text_without_marker = re.sub(pattern, '', text).strip()
+        text_without_marker = CHART_MARKER_RE.sub('', text).strip()
         return text_without_marker, chart_path
     
     return text, None
@@ -491,77 +515,56 @@ def extract_all_chart_paths(text: str) -> tuple[str, list[str]]:
         >>> text = "Here are the charts: __CHART__./chart1.png__CHART__ and __CHART__./chart2.png__CHART__"
         >>> clean_text, paths = extract_all_chart_paths(text)
         >>> print(paths)  # ["./chart1.png", "./chart2.png"]
+
+    Notes:
+        - Memoized per text: the chat history replays every past response
+          on each Streamlit rerun, entries never change once added
     """
-    pattern = r'__CHART__(.*?)__CHART__'
-    matches = re.findall(pattern, text)
-    
-    chart_paths = [match.strip() for match in matches]
-    text_without_markers = re.sub(pattern, '', text).strip()
-    
+    text_without_markers, chart_paths = _split_chart_markers(text)
+    return text_without_markers, list(chart_paths)
+
+
+@lru_cache(maxsize=256)
+def _split_chart_markers(text: str) -> tuple[str, tuple[str, ...]]:
+    """
+    Splits chart markers from text (cached backend of extract_all_chart_paths).
+
+    Args:
+        text: Text der möglicherweise mehrere Chart-Marker enthält
+
+    Returns:
+        tuple[str, tuple[str, ...]]: (text_without_markers, chart_paths)
+    """
+    # Schneller Pfad: Antworten ohne Chart brauchen keinen Regex-Durchlauf
+    if "__CHART__" not in text:
+        return text.strip(), ()
+
+    chart_paths = tuple(match.strip() for match in CHART_MARKER_RE.findall(text))
+    text_without_markers = CHART_MARKER_RE.sub('', text).strip()
+
     return text_without_markers, chart_paths
 
 
 def limit_session_history(session, max_history: int | None = None):
     """
-    Limits session history to the last N entries.
-    IMPORTANT: Removes __CHART__ markers from history for agent context!
+    Limits session history to the last N turns.
+    IMPORTANT: Chart markers are kept out of the agent context!
     
     Args:
-        session (Any): SQLiteSession object containing conversation history
-        max_history (int | None): Maximum number of history entries (None = unlimited). Defaults to None
+        session (Any): Agent session (InMemorySession) containing conversation history
+        max_history (int | None): Maximum number of history turns (None = unlimited). Defaults to None
     
     Returns:
-        Any: Session with limited history and cleaned responses
+        Any: The same session, configured to return only the latest turns
     
     Notes:
-        - Chart markers are removed to optimize token consumption
-        - Charts are only relevant for UI, not for agent context
-        - Returns original session on error (robustness)
+        - O(1) per call: only sets the turn limit, no history copy/rewrite
+        - InMemorySession strips __CHART__ markers once when items are added
+          and slices from the N-th latest user turn on read
+        - Sessions without max_turns support are returned unchanged
     """
-    try:
-        # Get current history
-        history = session.get_history()
-        
-        if not history:
-            return session
-        
-        # Clean chart markers for token optimization
-        # Charts are only relevant for UI, not for agent context
-        cleaned_history = []
-        for entry in history:
-            # Create copy of entry
-            cleaned_entry = entry.copy()
-            
-            # Clean response from chart markers
-            if "content" in cleaned_entry:
-                content = cleaned_entry["content"]
-                if isinstance(content, list):
-                    # Handle multi-part content
-                    cleaned_content = []
-                    for part in content:
-                        if isinstance(part, dict) and "text" in part:
-                            # Remove __CHART__path__CHART__ pattern
-                            cleaned_text = re.sub(r'__CHART__[^_]+__CHART__', '', part["text"])
-                            part["text"] = cleaned_text.strip()
-                        cleaned_content.append(part)
-                    cleaned_entry["content"] = cleaned_content
-                elif isinstance(content, str):
-                    # Handle simple string content
-                    cleaned_entry["content"] = re.sub(r'__CHART__[^_]+__CHART__', '', content).strip()
-            
-            cleaned_history.append(cleaned_entry)
-        
-        # Limit history if necessary
-        if max_history and len(cleaned_history) > max_history:
-            cleaned_history = cleaned_history[-max_history:]
-        
-        # Set cleaned history back
-        session.set_history(cleaned_history)
-            
-    except (AttributeError, Exception) as e:
-        # If session has no history methods or error occurs,
-        # return original (fallback for robustness)
-        pass
+    if hasattr(session, "max_turns"):
+        session.max_turns = max_history
     
     return session
 
@@ -573,7 +576,7 @@ async def process_query(customer_manager, user_input: str, session=None, history
     Args:
         customer_manager (Any): Customer Manager Agent instance
         user_input (str): User input query
-        session (Any | None): SQLiteSession for context management (optional). Defaults to None
+        session (Any | None): Agent session (SQLiteSession, InMemorySession) for context management (optional). Defaults to None
         history_limit (int | None): Maximum number of history entries (optional). Defaults to None
     
     Returns:
@@ -607,6 +610,47 @@ async def process_query(customer_manager, user_input: str, session=None, history
         return {"error": str(e), "error_type": type(e).__name__}
 
 
+async def process_queries_concurrently(
+    customer_manager,
+    queries: list[str],
+    max_concurrency: int = 5,
+) -> AsyncGenerator[tuple[int, Any, InMemorySession], None]:
+    """
+    Processes several independent queries concurrently with the multi-agent system.
+    
+    Args:
+        customer_manager (Any): Customer Manager Agent instance
+        queries (list[str]): User input queries
+        max_concurrency (int): Maximum number of agent runs in flight. Defaults to 5
+    
+    Yields:
+        tuple[int, Any, InMemorySession]: (index in queries, process_query result,
+            session of the run) in completion order
+    
+    Notes:
+        - Each query gets its own InMemorySession, so runs do not share or
+          race on conversation history; callers can merge the yielded
+          sessions into their main session afterwards
+        - Results are yielded as soon as each run finishes (as_completed),
+          callers can show partial results before all runs are done
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def run_one(index: int, query: str) -> tuple[int, Any, InMemorySession]:
+        async with semaphore:
+            session = InMemorySession(f"concurrent_query_{index}")
+            return index, await process_query(customer_manager, query, session=session), session
+
+    tasks = [asyncio.ensure_future(run_one(i, query)) for i, query in enumerate(queries)]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            yield await next_done
+    finally:
+        # Abbruch (z.B. Rerun/Fehler): noch laufende Agent-Runs beenden
+        for task in tasks:
+            task.cancel()
+
+
 async def process_query_streamed(
     customer_manager, 
     user_input: str, 
@@ -619,7 +663,7 @@ async def process_query_streamed(
     Args:
         customer_manager (Any): Customer Manager Agent instance
         user_input (str): User input query
-        session (Any | None): SQLiteSession for context management (optional). Defaults to None
+        session (Any | None): Agent session (SQLiteSession, InMemorySession) for context management (optional). Defaults to None
         history_limit (int | None): Maximum number of history entries (optional). Defaults to None
     
     Yields:
@@ -683,7 +727,7 @@ async def process_query_streamed(
         }
 
 
-def initialize_system(
+def load_system_collection(
     is_azure_openai: bool = False,
     csv_path: str = "./data/feedback_data.csv",
     vectorstore_type: str = "chroma",
@@ -695,7 +739,7 @@ def initialize_system(
     synthetic_end_date: str = datetime.now().strftime('%Y-%m-%d')
 ):
     """
-    Initializes the RAG system with all components.
+    Data phase of initialize_system: OpenAI client, CSV data and VectorStore.
     
     Args:
         is_azure_openai (bool): If True uses Azure OpenAI, if False uses standard OpenAI. Defaults to False
@@ -703,28 +747,104 @@ def initialize_system(
         vectorstore_type (str): Type of VectorStore (currently only "chroma" supported). Defaults to "chroma"
         create_new_store (bool): If True creates new VectorStore. Defaults to False
         embedding_model (str): OpenAI embedding model for VectorStore. Defaults to "text-embedding-ada-002"
-            - "text-embedding-ada-002": Best cross-lingual performance (78.4%)
-            - "text-embedding-3-small": Cheaper but weaker cross-lingual (29.4%)
-            - "text-embedding-3-large": More expensive but also weak cross-lingual (32.2%)
         is_synthetic_data (bool): If True uses synthetic data (no enhancement), if False uses original data. Defaults to False
         n_synthetic_samples (int): Number of synthetic records (only if is_synthetic_data=True). Defaults to 10000
         synthetic_start_date (str): Start date for synthetic data (format: 'YYYY-MM-DD'). Defaults to '2023-01-01'
         synthetic_end_date (str): End date for synthetic data (format: 'YYYY-MM-DD'). Defaults to current date
     
     Returns:
-        tuple[Any, Any]: (customer_manager, collection) where:
-            - customer_manager (Any): Configured Customer Manager Agent instance
-            - collection (Any): ChromaDB Collection instance
+        Any: ChromaDB Collection instance (non-empty)
     
     Raises:
         ValueError: If API keys are missing or VectorStore cannot be created
         FileNotFoundError: If CSV file does not exist (for original data)
     
     Notes:
-        - Initializes OpenAI client (Azure or standard)
-        - Loads and enhances CSV data (automatically saved for original data)
-        - Creates/loads VectorStore with chosen embedding model
-        - Configures multi-agent system
+        - The CSV is only loaded (and enhanced) if the VectorStore has to be
+          built; an existing store is opened without source data
+        - One Chroma open per call: opening the existing store doubles as
+          the existence check
+        - Client setup runs concurrently with opening the store / CSV loading
+        - Independent of the agent modules, so it can be cached separately
+          from build_agent_system
+    """
+    def require_csv() -> None:
+        # Load and enhance CSV data (conditional based on data type)
+        if not is_synthetic_data and not os.path.exists(csv_path):
+            raise FileNotFoundError(f"CSV file not found: {csv_path}")
+
+    # Neuaufbau braucht die CSV: fehlende Datei vor dem Öffnen von Chroma melden
+    if create_new_store:
+        require_csv()
+
+    # Client-Initialisierung läuft parallel zum Öffnen des Stores bzw. CSV-Laden
+    with ThreadPoolExecutor(max_workers=2, thread_name_prefix="init") as executor:
+        client_future = executor.submit(
+            get_azure_openai_client if is_azure_openai else get_openai_client
+        )
+
+        # Existierenden Store direkt öffnen (ersetzt eine separate Existenzprüfung
+        # mit eigenem Client); die CSV wird nur geladen, wenn keiner existiert
+        collection = None
+        if not create_new_store:
+            collection = load_vectorstore(
+                data=None,
+                type=vectorstore_type,
+                embedding_model=embedding_model
+            )
+
+        data_future = None
+        if collection is None:
+            require_csv()
+            data_future = executor.submit(
+                load_csv,
+                path=csv_path,
+                is_synthetic=is_synthetic_data,
+                n_synthetic_samples=n_synthetic_samples,
+                synthetic_start_date=synthetic_start_date,
+                synthetic_end_date=synthetic_end_date,
+            )
+
+        # OpenAI client is required before the VectorStore is built
+        if client_future.result() is None:
+            client_label = "Azure OpenAI Client" if is_azure_openai else "OpenAI Client"
+            raise ValueError(f"❌ {client_label} could not be initialized!")
+        customer_data = data_future.result() if data_future is not None else None
+
+    # Create VectorStore with specified embedding model (only if not opened above)
+    if collection is None:
+        collection = load_vectorstore(
+            data=customer_data, 
+            type=vectorstore_type, 
+            create_new_store=create_new_store,
+            embedding_model=embedding_model
+        )
+    
+    if collection is None:
+        raise ValueError("❌ VectorStore could not be created/loaded!")
+    
+    if collection.count() == 0:
+        raise ValueError("❌ VectorStore is empty - no documents were created!")
+
+    return collection
+
+
+def build_agent_system(collection, embedding_model: str = "text-embedding-ada-002"):
+    """
+    Agent phase of initialize_system: tools, metadata snapshot and agent hierarchy.
+    
+    Args:
+        collection (Any): Loaded ChromaDB Collection (see load_system_collection)
+        embedding_model (str): Embedding model of the collection (for query embeddings).
+                             Defaults to "text-embedding-ada-002"
+    
+    Returns:
+        Any: Configured Customer Manager Agent instance
+    
+    Notes:
+        - Requires the OpenAI client set up by load_system_collection
+        - The metadata snapshot (full metadata scan) overlaps with
+          tool/agent construction
     """
     # Import agent modules locally to avoid circular imports
     from customer_agents.chart_creator_agent import create_chart_creator_agent
@@ -734,67 +854,40 @@ def initialize_system(
     from customer_agents_tools.get_metadata_tool import create_metadata_tool
     from customer_agents_tools.create_charts_tool import create_chart_creation_tool
     from customer_agents.output_summarizer_agent import create_output_summarizer_agent
-    
-    # Initialize OpenAI client FIRST (required for VectorStore)
-    if is_azure_openai:
-        azure_client = get_azure_openai_client()
-        if azure_client is None:
-            raise ValueError("❌ Azure OpenAI Client could not be initialized!")
-    else:
-        openai_client = get_openai_client()
-        if openai_client is None:
-            raise ValueError("❌ OpenAI Client could not be initialized!")
-    
-    # Load and enhance CSV data (conditional based on data type)
-    if not is_synthetic_data and not os.path.exists(csv_path):
-        raise FileNotFoundError(f"CSV file not found: {csv_path}")
-        
-    customer_data = load_csv(
-        path=csv_path, 
-        is_synthetic=is_synthetic_data,
-        n_synthetic_samples=n_synthetic_samples,
-        synthetic_start_date=synthetic_start_date,
-        synthetic_end_date=synthetic_end_date
-    )
 
-    # Load or create VectorStore with specified embedding model
-    collection = load_vectorstore(
-        data=customer_data, 
-        type=vectorstore_type, 
-        create_new_store=create_new_store,
-        embedding_model=embedding_model
-    )
-    
-    if collection is None:
-        raise ValueError("❌ VectorStore could not be created/loaded!")
-    
-    if collection.count() == 0:
-        raise ValueError("❌ VectorStore is empty - no documents were created!")
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="init") as executor:
+        # Build metadata snapshot (pre-compute all metadata for Customer Manager)
+        # This avoids repeated tool calls and embeds metadata directly in the agent instructions
+        # Liest alle Metadaten aus Chroma: im Hintergrund, während Tools/Agenten entstehen
+        build_metadata_snapshot = create_metadata_tool(collection)
+        snapshot_future = executor.submit(build_metadata_snapshot)
+
+        # Create tools for agents
+        # Semantischer Query-Cache: wiederholte/ähnliche Suchen ohne Chroma-Roundtrip
+        search_customer_feedback = SearchToolFactory.create_search_tool(
+            collection,
+            embedding_function=ChromaVectorStore.create_embedding_function(embedding_model),
+            query_cache=SemanticQueryCache(),
+        )
 
-    # Create tools for agents
-    search_customer_feedback = SearchToolFactory.create_search_tool(collection)
-    build_metadata_snapshot = create_metadata_tool(collection)
-    
-    # Build metadata snapshot (pre-compute all metadata for Customer Manager)
-    # This avoids repeated tool calls and embeds metadata directly in the agent instructions
-    metadata_snapshot = build_metadata_snapshot()
+        # Create agent hierarchy with native handoffs
+        output_summarizer = create_output_summarizer_agent()
 
-    # Create agent hierarchy with native handoffs
-    output_summarizer = create_output_summarizer_agent()
+        # Create Feedback Analysis Agent (focused on search and content analysis)
+        feedback_analysis_agent = create_feedback_analysis_agent(
+            search_tool=search_customer_feedback,
+            handoff_agents=[output_summarizer],
+        )
 
-    # Create Feedback Analysis Agent (focused on search and content analysis)
-    feedback_analysis_agent = create_feedback_analysis_agent(
-        search_tool=search_customer_feedback,
-        handoff_agents=[output_summarizer],
-    )
+        # Create Chart Creator Agent (reads market mappings from Session Context)
+        chart_creation_agent = create_chart_creator_agent(
+            chart_creation_tool=create_chart_creation_tool(collection)
+        )
 
-    # Create Chart Creator Agent (reads market mappings from Session Context)
-    chart_creation_agent = create_chart_creator_agent(
-        chart_creation_tool=create_chart_creation_tool(collection)
-    )
+        metadata_snapshot = snapshot_future.result()
 
     # Customer Manager with embedded metadata snapshot (no metadata_analysis_agent needed)
-    customer_manager = create_customer_manager_agent(
+    return create_customer_manager_agent(
         metadata_snapshot=metadata_snapshot,  # Pre-computed metadata embedded in instructions
         handoff_agents=[
             feedback_analysis_agent,  # For content analysis
@@ -802,4 +895,62 @@ def initialize_system(
         ],
     )
 
+
+def initialize_system(
+    is_azure_openai: bool = False,
+    csv_path: str = "./data/feedback_data.csv",
+    vectorstore_type: str = "chroma",
+    create_new_store: bool = False,
+    embedding_model: str = "text-embedding-ada-002",
+    is_synthetic_data: bool = False,
+    n_synthetic_samples: int = 10000,
+    synthetic_start_date: str = '2023-01-01',
+    synthetic_end_date: str = datetime.now().strftime('%Y-%m-%d')
+):
+    """
+    Initializes the RAG system with all components.
+    
+    Args:
+        is_azure_openai (bool): If True uses Azure OpenAI, if False uses standard OpenAI. Defaults to False
+        csv_path (str): Path to CSV file with feedback data. Defaults to "./data/feedback_data.csv"
+        vectorstore_type (str): Type of VectorStore (currently only "chroma" supported). Defaults to "chroma"
+        create_new_store (bool): If True creates new VectorStore. Defaults to False
+        embedding_model (str): OpenAI embedding model for VectorStore. Defaults to "text-embedding-ada-002"
+            - "text-embedding-ada-002": Best cross-lingual performance (78.4%)
+            - "text-embedding-3-small": Cheaper but weaker cross-lingual (29.4%)
+            - "text-embedding-3-large": More expensive but also weak cross-lingual (32.2%)
+        is_synthetic_data (bool): If True uses synthetic data (no enhancement), if False uses original data. Defaults to False
+        n_synthetic_samples (int): Number of synthetic records (only if is_synthetic_data=True). Defaults to 10000
+        synthetic_start_date (str): Start date for synthetic data (format: 'YYYY-MM-DD'). Defaults to '2023-01-01'
+        synthetic_end_date (str): End date for synthetic data (format: 'YYYY-MM-DD'). Defaults to current date
+    
+    Returns:
+        tuple[Any, Any]: (customer_manager, collection) where:
+            - customer_manager (Any): Configured Customer Manager Agent instance
+            - collection (Any): ChromaDB Collection instance
+    
+    Raises:
+        ValueError: If API keys are missing or VectorStore cannot be created
+        FileNotFoundError: If CSV file does not exist (for original data)
+    
+    Notes:
+        - Initializes OpenAI client (Azure or standard)
+        - Loads and enhances CSV data (automatically saved for original data)
+        - Creates/loads VectorStore with chosen embedding model
+        - Configures multi-agent system
+        - Runs load_system_collection followed by build_agent_system
+    """
+    collection = load_system_collection(
+        is_azure_openai=is_azure_openai,
+        csv_path=csv_path,
+        vectorstore_type=vectorstore_type,
+        create_new_store=create_new_store,
+        embedding_model=embedding_model,
+        is_synthetic_data=is_synthetic_data,
+        n_synthetic_samples=n_synthetic_samples,
+        synthetic_start_date=synthetic_start_date,
+        synthetic_end_date=synthetic_end_date,
+    )
+    customer_manager = build_agent_system(collection, embedding_model=embedding_model)
+
     return customer_manager, collection
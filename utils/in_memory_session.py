@@ -0,0 +1,134 @@
+"""
+In-Memory Session - Lightweight agent session without SQLite.
+
+Implements the session interface used by the Agents SDK Runner
+(get_items, add_items, pop_item, clear_session) on a plain Python list.
+Intended for non-persistent Streamlit sessions.
+"""
+
+from typing import Any, List, Optional
+
+# Chart-Marker (__CHART__pfad__CHART__) sind nur für die UI relevant
+from utils.chart_markers import CHART_MARKER_RE
+
+
+def _strip_chart_markers(item: Any) -> Any:
+    """
+    Removes chart markers from the text of a conversation item.
+
+    Args:
+        item (Any): Conversation item as produced by the Runner
+
+    Returns:
+        Any: The item itself if it has no markers, otherwise a cleaned copy
+    """
+    if not isinstance(item, dict):
+        return item
+
+    content = item.get("content")
+    if isinstance(content, str):
+        if "__CHART__" not in content:
+            return item
+        return {**item, "content": CHART_MARKER_RE.sub('', content).strip()}
+
+    if isinstance(content, list) and any(
+        isinstance(part, dict) and "__CHART__" in str(part.get("text", ""))
+        for part in content
+    ):
+        cleaned_content = []
+        for part in content:
+            if isinstance(part, dict) and "__CHART__" in str(part.get("text", "")):
+                part = {**part, "text": CHART_MARKER_RE.sub('', part["text"]).strip()}
+            cleaned_content.append(part)
+        return {**item, "content": cleaned_content}
+
+    return item
+
+
+class InMemorySession:
+    """
+    Agent session that keeps conversation items in process memory.
+
+    Drop-in replacement for SQLiteSession(session_id, ":memory:"): same
+    lifetime (browser session), but no sqlite3 driver, SQL parsing or JSON
+    serialization per stored item.
+
+    Attributes:
+        session_id (str): Session identifier (used for tracing group IDs)
+        max_turns (Optional[int]): Only the latest N user turns are returned
+            to the Runner. None = unlimited
+    """
+
+    def __init__(self, session_id: str, max_turns: Optional[int] = None):
+        self.session_id = session_id
+        self.max_turns = max_turns
+        self._items: List[Any] = []
+        # Index des ersten Items jedes User-Turns (für O(1)-Begrenzung)
+        self._turn_starts: List[int] = []
+
+    async def get_items(self, limit: Optional[int] = None) -> List[Any]:
+        """
+        Retrieves the conversation items of this session.
+
+        Args:
+            limit (Optional[int]): Only return the latest N items. None returns all items
+
+        Returns:
+            List[Any]: Items in chronological order (copy of the internal list)
+
+        Notes:
+            - With max_turns set, history starts at the N-th latest user message,
+              so tool calls and their outputs are never split
+        """
+        start = 0
+        if self.max_turns and len(self._turn_starts) > self.max_turns:
+            start = self._turn_starts[-self.max_turns]
+
+        if limit is None:
+            return self._items[start:]
+        if limit <= 0:
+            return []
+        return self._items[max(start, len(self._items) - limit):]
+
+    async def add_items(self, items: List[Any]) -> None:
+        """
+        Appends new items to the conversation.
+
+        Args:
+            items (List[Any]): Items produced by the Runner for the current turn
+
+        Returns:
+            None
+
+        Notes:
+            - Chart markers are stripped once here (token optimization for the
+              agent context), each item is processed exactly once
+        """
+        for item in items:
+            if isinstance(item, dict) and item.get("role") == "user":
+                self._turn_starts.append(len(self._items))
+            self._items.append(_strip_chart_markers(item))
+
+    async def pop_item(self) -> Optional[Any]:
+        """
+        Removes and returns the most recent item.
+
+        Returns:
+            Optional[Any]: The removed item, or None if the session is empty
+        """
+        if not self._items:
+            return None
+        item = self._items.pop()
+        if self._turn_starts and self._turn_starts[-1] == len(self._items):
+            self._turn_starts.pop()
+        return item
+
+    async def clear_session(self) -> None:
+        """
+        Removes all items from the session.
+
+        Returns:
+            None
+        """
+        self._items.clear()
+        self._turn_starts.clear()
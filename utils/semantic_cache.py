@@ -0,0 +1,170 @@
+"""
+🧠 Semantic Query Cache - Reuses search results for (near-)identical queries
+
+In-process cache in front of the feedback search: identical query texts
+(compared case- and whitespace-insensitively) are answered without any
+embedding request, near-identical queries (cosine similarity of the query
+embeddings above a strict threshold) skip the Chroma search.
+"""
+
+import re
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+
+class _CachePartition:
+    """Cached queries that share the same search parameters (filter, result count)"""
+
+    def __init__(self):
+        self.texts: List[str] = []
+        self.embeddings: Optional[np.ndarray] = None  # L2-normalisiert, eine Zeile pro Query
+        self.results: List[Any] = []
+        self.created: List[float] = []
+
+
+class SemanticQueryCache:
+    """
+    Thread-safe semantic cache for vector search results.
+
+    Attributes:
+        similarity_threshold (float): Minimum cosine similarity for a semantic hit
+            (strict by default: "Beschwerden in DE" vs. "Beschwerden in AT" can
+            already reach ~0.97 with Ada-002)
+        ttl_seconds (float): Lifetime of a cached result in seconds
+        max_entries (int): Max. cached queries per partition (oldest are evicted)
+    """
+
+    def __init__(
+        self,
+        similarity_threshold: float = 0.99,
+        ttl_seconds: float = 3600,
+        max_entries: int = 256,
+    ):
+        self.similarity_threshold = similarity_threshold
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._partitions: Dict[Any, _CachePartition] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _evict_expired(self, partition: _CachePartition) -> None:
+        # Einträge sind nach Erstellzeit sortiert → abgelaufene bilden ein Präfix
+        cutoff = time.monotonic() - self.ttl_seconds
+        expired = 0
+        while expired < len(partition.created) and partition.created[expired] < cutoff:
+            expired += 1
+        if expired:
+            del partition.texts[:expired], partition.results[:expired], partition.created[:expired]
+            partition.embeddings = partition.embeddings[expired:]
+
+    def get_exact(self, key: Any, query_text: str) -> Optional[Any]:
+        """
+        Looks up a cached result for the same query text (case and
+        whitespace are ignored).
+
+        Args:
+            key (Any): Hashable search parameters (filter, result count)
+            query_text (str): Query text
+
+        Returns:
+            Optional[Any]: Cached result, or None on miss/expiry
+        """
+        text = self._normalize_text(query_text)
+        with self._lock:
+            partition = self._partitions.get(key)
+            if partition is None:
+                return None
+            self._evict_expired(partition)
+            # Neueste Einträge zuerst
+            for index in range(len(partition.texts) - 1, -1, -1):
+                if partition.texts[index] == text:
+                    self.hits += 1
+                    return partition.results[index]
+            return None
+
+    def get_similar(self, key: Any, embedding: np.ndarray) -> Optional[Any]:
+        """
+        Looks up the most similar cached query above the similarity threshold.
+
+        Args:
+            key (Any): Hashable search parameters (filter, result count)
+            embedding (np.ndarray): Query embedding (any norm)
+
+        Returns:
+            Optional[Any]: Cached result, or None on miss/expiry
+        """
+        query = self._normalize(embedding)
+        with self._lock:
+            partition = self._partitions.get(key)
+            if partition is not None:
+                self._evict_expired(partition)
+            if partition is None or not partition.texts:
+                self.misses += 1
+                return None
+
+            # Nach _evict_expired sind alle verbleibenden Einträge frisch
+            similarities = partition.embeddings @ query
+            best = int(np.argmax(similarities))
+            if similarities[best] >= self.similarity_threshold:
+                self.hits += 1
+                return partition.results[best]
+
+            self.misses += 1
+            return None
+
+    def add(self, key: Any, query_text: str, embedding: np.ndarray, result: Any) -> None:
+        """
+        Stores a search result.
+
+        Args:
+            key (Any): Hashable search parameters (filter, result count)
+            query_text (str): Query text
+            embedding (np.ndarray): Query embedding (any norm)
+            result (Any): Search result to cache
+
+        Returns:
+            None
+        """
+        row = self._normalize(embedding)[np.newaxis, :]
+        text = self._normalize_text(query_text)
+        with self._lock:
+            partition = self._partitions.setdefault(key, _CachePartition())
+            self._evict_expired(partition)
+            if len(partition.texts) >= self.max_entries:
+                # Ältesten Eintrag verdrängen
+                del partition.texts[0], partition.results[0], partition.created[0]
+                partition.embeddings = partition.embeddings[1:]
+
+            partition.texts.append(text)
+            partition.results.append(result)
+            partition.created.append(time.monotonic())
+            partition.embeddings = (
+                row if partition.embeddings is None or len(partition.embeddings) == 0
+                else np.vstack([partition.embeddings, row])
+            )
+
+    def clear(self) -> None:
+        """
+        Removes all cached results (e.g. after the VectorStore was rebuilt).
+
+        Returns:
+            None
+        """
+        with self._lock:
+            self._partitions.clear()
+            self.hits = 0
+            self.misses = 0
+
+    @staticmethod
+    def _normalize_text(query_text: str) -> str:
+        return re.sub(r"\s+", " ", query_text).strip().lower()
+
+    @staticmethod
+    def _normalize(embedding: np.ndarray) -> np.ndarray:
+        vector = np.asarray(embedding, dtype=np.float32).ravel()
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm > 0 else vector
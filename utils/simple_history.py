@@ -9,6 +9,9 @@ from typing import List, Dict, Any, Optional
 from datetime import datetime
 import json
 
+# Chart-Marker (__CHART__pfad__CHART__), gemeinsames Muster
+from utils.chart_markers import CHART_MARKER_RE
+
 try:
     import tiktoken
 
@@ -67,6 +70,18 @@ class SimpleConversationHistory:
     def __init__(self):
         self.history: List[Dict[str, Any]] = []
         self.session_id = datetime.now().strftime("%Y%m%d_%H%M%S")
+        self._reset_stats()
+
+    def _reset_stats(self):
+        """
+        Resets the running aggregates used by get_summary_stats.
+
+        Returns:
+            None
+        """
+        self._agent_counts: Dict[str, int] = {}
+        self._total_user_tokens = 0
+        self._total_response_tokens = 0
 
     def add_interaction(
         self,
@@ -74,6 +89,8 @@ class SimpleConversationHistory:
         agent_response: str,
         agent_name: str = "Assistant",
         metadata: Optional[Dict[str, Any]] = None,
+        text: Optional[str] = None,
+        chart_paths: Optional[List[str]] = None,
     ):
         """
         Adds a user-agent interaction to the history.
@@ -83,6 +100,10 @@ class SimpleConversationHistory:
             agent_response (str): The agent's response
             agent_name (str): Name of the responding agent. Defaults to "Assistant"
             metadata (Optional[Dict[str, Any]]): Additional metadata for the interaction
+            text (Optional[str]): Display text with chart markers removed.
+                                Defaults to the response itself
+            chart_paths (Optional[List[str]]): Chart paths extracted from the response.
+                                             Defaults to an empty list
 
         Returns:
             None
@@ -91,17 +112,26 @@ class SimpleConversationHistory:
             - Automatically timestamps each interaction
             - Ensures response is converted to string for UI display
             - Metadata defaults to empty dict if not provided
+            - text/chart_paths are computed once by the caller so that
+              replaying the history does not re-parse every response
         """
         entry = {
             "timestamp": datetime.now().isoformat(),
             "user": user_input,
             "agent": agent_name,
             "response": str(agent_response),  # Ensure string for UI display
+            "text": str(agent_response) if text is None else text,
+            "chart_paths": list(chart_paths) if chart_paths else [],
             "metadata": metadata or {},
         }
 
         self.history.append(entry)
 
+        # Laufende Aggregate für get_summary_stats (Token einmal pro Eintrag zählen)
+        self._agent_counts[agent_name] = self._agent_counts.get(agent_name, 0) + 1
+        self._total_user_tokens += count_tokens(entry["user"])
+        self._total_response_tokens += count_tokens(entry["response"])
+
     def get_history(self, last_n: Optional[int] = None, strip_charts: bool = False) -> List[Dict[str, Any]]:
         """
         Retrieves the conversation history.
@@ -117,26 +147,33 @@ class SimpleConversationHistory:
                 - user (str): User input
                 - agent (str): Agent name
                 - response (str): Agent response (with or without chart markers)
+                - text (str): Display text without chart markers
+                - chart_paths (list): Chart paths referenced by the response
                 - metadata (dict): Additional metadata
                 
         Notes:
             - Returns copy of history to prevent accidental modifications
             - Chart stripping uses regex pattern: __CHART__.*?__CHART__
+            - Only entries whose response changes are copied; all other
+              entries are shared, like in the unstripped list copy
             - Useful for reducing token count in agent context
         """
         history = self.history[-last_n:] if last_n and last_n > 0 else self.history.copy()
         
         if strip_charts:
             # Entferne Chart-Marker für Agent-Kontext (Token-Optimierung)
-            import re
             cleaned_history = []
             for entry in history:
-                cleaned_entry = entry.copy()
                 response = entry["response"]
-                # Entferne __CHART__pfad__CHART__ Pattern
-                cleaned_response = re.sub(r'__CHART__[^_]+__CHART__', '', response)
-                cleaned_entry["response"] = cleaned_response.strip()
-                cleaned_history.append(cleaned_entry)
+                # Entferne __CHART__pfad__CHART__ Pattern (nur wenn vorhanden)
+                if "__CHART__" in response:
+                    response = CHART_MARKER_RE.sub('', response)
+                cleaned_response = response.strip()
+                # Unveränderte Einträge teilen statt kopieren
+                if cleaned_response == entry["response"]:
+                    cleaned_history.append(entry)
+                else:
+                    cleaned_history.append({**entry, "response": cleaned_response})
             return cleaned_history
         
         return history
@@ -177,6 +214,7 @@ class SimpleConversationHistory:
         """
         self.history.clear()
         self.session_id = datetime.now().strftime("%Y%m%d_%H%M%S")
+        self._reset_stats()
 
     def get_conversation_count(self) -> int:
         """
@@ -278,32 +316,23 @@ class SimpleConversationHistory:
             - Returns minimal stats if history is empty
             - Token counts use tiktoken or character-based fallback
             - Aggregates agent usage across all interactions
+            - O(1): counts are maintained in add_interaction/clear_history
+              instead of re-tokenizing the whole history per call
         """
         if not self.history:
             return {"total_interactions": 0, "session_id": self.session_id}
 
-        # Zähle Agent-Typen und Token
-        agents = {}
-        total_user_tokens = 0
-        total_response_tokens = 0
-
-        for entry in self.history:
-            agent = entry["agent"]
-            agents[agent] = agents.get(agent, 0) + 1
-            total_user_tokens += count_tokens(entry["user"])
-            total_response_tokens += count_tokens(entry["response"])
-
         first_interaction = self.history[0]["timestamp"]
         last_interaction = self.history[-1]["timestamp"]
 
         return {
             "session_id": self.session_id,
             "total_interactions": len(self.history),
-            "agents_used": agents,
+            "agents_used": dict(self._agent_counts),
             "first_interaction": first_interaction,
             "last_interaction": last_interaction,
-            "avg_user_input_length": total_user_tokens // len(self.history),
-            "avg_response_length": total_response_tokens // len(self.history),
+            "avg_user_input_length": self._total_user_tokens // len(self.history),
+            "avg_response_length": self._total_response_tokens // len(self.history),
         }
 
 
@@ -15,6 +15,7 @@ import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
 import random
+import re
 import string
 import itertools
 from typing import List, Dict, Tuple, Optional
@@ -376,7 +377,6 @@ class AdvancedSyntheticFeedbackGenerator:
         anonymized = sentence
         
         # Ersetze Uhrzeiten
-        import re
         anonymized = re.sub(r'\d{1,2}:\d{2}', 'XX:XX', anonymized)
         anonymized = re.sub(r'\d{1,2}\.\d{2}', 'XX:XX', anonymized)
         